@@ -1,29 +1,26 @@
 """
 Debug the canonical ID creation process for Brady/Mahomes
 """
-import nfl_data_py as nfl
+import numpy as np
 import pandas as pd
+from debug_data import NAME_RE, QB_STAR_RE, buffered_output, load_draft_picks, load_matching_rosters, load_players
 
 def debug_canonical_id_creation():
     print("🔍 DEBUGGING CANONICAL ID CREATION")
     print("=" * 50)
     
     # Replicate the ETL process for just Brady/Mahomes
-    years = [2020, 2021, 2022, 2023, 2024]
+    years = (2020, 2021, 2022, 2023, 2024)
     
+    # Only the star players' rows are read out of the roster Parquet
     print("1️⃣ Loading roster data...")
-    rosters = nfl.import_seasonal_rosters(years=years)
+    star_rosters = load_matching_rosters(years, QB_STAR_RE)
     
     print("2️⃣ Loading players master...")
-    players_master = nfl.import_players()
+    players_master = load_players()
     
     print("3️⃣ Loading draft data...")
-    draft_picks = nfl.import_draft_picks(years=years)
-    
-    # Filter to just our star players
-    star_rosters = rosters[
-        rosters['player_name'].str.contains('Tom Brady|Patrick Mahomes', case=False, na=False)
-    ].copy()
+    draft_picks = load_draft_picks(years)
     
     print(f"\n4️⃣ Star player roster records: {len(star_rosters)}")
     print("Raw star roster sample:")
@@ -32,16 +29,19 @@ def debug_canonical_id_creation():
     # Step 1: Merge with players_master
     print(f"\n5️⃣ Merging with players_master...")
     
-    # Check what Brady/Mahomes look like in master data
+    # Check what Brady/Mahomes look like in master data (scan the full master once)
+    star_master = players_master[
+        players_master['display_name'].str.contains(QB_STAR_RE, na=False)
+    ]
     print("Brady in players_master:")
-    brady_master = players_master[players_master['display_name'].str.contains('Tom Brady', case=False, na=False)]
+    brady_master = star_master[star_master['display_name'].str.contains(NAME_RE['Tom Brady'])]
     if len(brady_master) > 0:
         print(brady_master[['display_name', 'esb_id', 'gsis_id']].to_string(index=False))
     else:
         print("   ❌ Tom Brady NOT found in players_master!")
         
         # Check if there's a Brady with the same esb_id
-        brady_esb_id = star_rosters[star_rosters['player_name'].str.contains('Tom Brady', case=False)]['esb_id'].iloc[0]
+        brady_esb_id = star_rosters[star_rosters['player_name'].str.contains(NAME_RE['Tom Brady'])]['esb_id'].iloc[0]
         brady_by_esb = players_master[players_master['esb_id'] == brady_esb_id]
         if len(brady_by_esb) > 0:
             print(f"   Found player with Brady's esb_id ({brady_esb_id}):")
@@ -50,21 +50,26 @@ def debug_canonical_id_creation():
             print(f"   ❌ No player found with Brady's esb_id ({brady_esb_id})")
     
     print("\nMahomes in players_master:")
-    mahomes_master = players_master[players_master['display_name'].str.contains('Patrick Mahomes', case=False, na=False)]
+    mahomes_master = star_master[star_master['display_name'].str.contains(NAME_RE['Patrick Mahomes'])]
     if len(mahomes_master) > 0:
         print(mahomes_master[['display_name', 'esb_id', 'gsis_id']].to_string(index=False))
     else:
         print("   ❌ Patrick Mahomes NOT found in players_master!")
     
     # Do the actual merge
-    players_master_clean = players_master.drop_duplicates(subset=['esb_id'], keep='first')
-    master_to_merge = players_master_clean[['esb_id', 'display_name', 'college_name', 'position', 'gsis_id']].rename(columns={
-        'position': 'position_master',
-        'college_name': 'college_master',
-        'display_name': 'display_name_master'
-    })
-    
-    merged = star_rosters.merge(master_to_merge, on='esb_id', how='left')
+    # Project to the merge columns before deduplicating so the hash pass only touches those
+    master_to_merge = (players_master[['esb_id', 'display_name', 'college_name', 'position', 'gsis_id']]
+        .rename(columns={
+            'position': 'position_master',
+            'college_name': 'college_master',
+            'display_name': 'display_name_master'
+        })
+        .dropna(subset=['esb_id'])
+        .drop_duplicates(subset=['esb_id'], keep='first')
+        .set_index('esb_id'))
+    
+    # Index-keyed joins probe the (unique) master index directly instead of building a merge hash table
+    merged = star_rosters.join(master_to_merge, on='esb_id').reset_index(drop=True)
     
     print(f"\n6️⃣ After merge with players_master:")
     print(merged[['player_name', 'display_name_master', 'esb_id', 'gsis_id']].drop_duplicates().to_string(index=False))
@@ -79,31 +84,44 @@ def debug_canonical_id_creation():
     
     # Step 2: Add draft info
     print(f"\n7️⃣ Adding draft info...")
-    draft_info = draft_picks[['gsis_id', 'season']].copy()
-    draft_info = draft_info.rename(columns={'season': 'draft_year'})
+    draft_info = draft_picks[['gsis_id', 'season']].rename(columns={'season': 'draft_year'}).set_index('gsis_id')
     
-    merged_with_draft = merged.merge(draft_info, on='gsis_id', how='left')
-    merged_with_draft['draft_year'] = merged_with_draft['draft_year'].fillna(0).astype(int)
+    merged_with_draft = merged.join(draft_info, on='gsis_id').reset_index(drop=True)
+    # Nullable Int32 keeps undrafted players as <NA> instead of a fake 0 year
+    merged_with_draft['draft_year'] = merged_with_draft['draft_year'].astype('Int32')
+    
+    # One narrow, deduplicated projection backs every ID display below
+    id_view = merged_with_draft[['player_name', 'esb_id', 'gsis_id', 'player_id', 'draft_year']].drop_duplicates()
     
     print("After adding draft info:")
-    print(merged_with_draft[['player_name', 'esb_id', 'gsis_id', 'draft_year']].drop_duplicates().to_string(index=False))
+    print(id_view[['player_name', 'esb_id', 'gsis_id', 'draft_year']].drop_duplicates().to_string(index=False))
     
     # Step 3: Create canonical ID (THE CRITICAL STEP)
     print(f"\n8️⃣ Creating canonical ID...")
     
     print("Before canonical ID creation:")
-    for _, row in merged_with_draft[['player_name', 'esb_id', 'gsis_id', 'player_id']].drop_duplicates().iterrows():
-        print(f"   {row['player_name']}: esb_id={row['esb_id']}, gsis_id={row['gsis_id']}, player_id={row['player_id']}")
-    
-    # Create canonical ID (exact same logic as ETL)
-    merged_with_draft['id'] = merged_with_draft['esb_id'].fillna(merged_with_draft['gsis_id'])
-    missing_id_count = merged_with_draft['id'].isna().sum()
+    before_ids = id_view[['player_name', 'esb_id', 'gsis_id', 'player_id']].drop_duplicates().astype(str)
+    lines = (
+        '   ' + before_ids['player_name'] + ': esb_id=' + before_ids['esb_id'] +
+        ', gsis_id=' + before_ids['gsis_id'] + ', player_id=' + before_ids['player_id']
+    )
+    if len(lines) > 0:
+        print('\n'.join(lines))
+    
+    # Create canonical ID (exact same logic as ETL): esb_id, then gsis_id, then player_id in one pass
+    esb = merged_with_draft['esb_id'].to_numpy()
+    gsis = merged_with_draft['gsis_id'].to_numpy()
+    has_esb = pd.notna(esb)
+    has_gsis = pd.notna(gsis)
+    missing_id_count = int((~has_esb & ~has_gsis).sum())
     if missing_id_count > 0:
         print(f"   Filling {missing_id_count} missing IDs with player_id")
-        merged_with_draft['id'].fillna(merged_with_draft['player_id'], inplace=True)
+    merged_with_draft['id'] = np.where(
+        has_esb, esb, np.where(has_gsis, gsis, merged_with_draft['player_id'].to_numpy())
+    )
     
     print("After canonical ID creation:")
-    final_ids = merged_with_draft[['player_name', 'id', 'esb_id', 'gsis_id', 'player_id']].drop_duplicates()
+    final_ids = id_view.assign(id=merged_with_draft['id'])[['player_name', 'id', 'esb_id', 'gsis_id', 'player_id']].drop_duplicates()
     print(final_ids.to_string(index=False))
     
     # Step 4: Test connection building with these IDs
@@ -131,4 +149,5 @@ def debug_canonical_id_creation():
         print("❌ No records left after REG/POST filter!")
 
 if __name__ == "__main__":
-    debug_canonical_id_creation()
+    with buffered_output():
+        debug_canonical_id_creation()
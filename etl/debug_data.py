@@ -0,0 +1,185 @@
+"""
+Shared data loading for the debug scripts.
+
+Every nfl_data_py pull is persisted as Parquet under etl/.cache so repeated
+debugging runs read the local copy instead of re-downloading it. The load_*
+helpers also memoize in-process, so scripts run back to back share one frame;
+treat the returned frames as read-only.
+"""
+import io
+import os
+import re
+import sys
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+import nfl_data_py as nfl
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from psycopg2 import sql as pg_sql
+from pyarrow import csv as pa_csv
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# Player-name patterns shared by the debug scripts, compiled once
+STAR_NAMES = ['Tom Brady', 'Patrick Mahomes', 'Aaron Donald', 'Justin Jefferson']
+QB_STAR_RE = re.compile('Tom Brady|Patrick Mahomes', re.IGNORECASE)
+STAR_LAST_NAME_RE = re.compile('|'.join(name.split()[-1] for name in STAR_NAMES), re.IGNORECASE)
+NAME_RE = {name: re.compile(name, re.IGNORECASE) for name in STAR_NAMES}
+
+@contextmanager
+def buffered_output():
+    """Collect everything printed inside the block and write it to stdout in a single call."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield buf
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+def split_by_star(df, col):
+    """
+    Map each of STAR_NAMES to the rows of df whose col contains that star's last name,
+    using a single regex extract over the column instead of one scan per star.
+    """
+    last_names = df[col].str.extract(f'({STAR_LAST_NAME_RE.pattern})', flags=re.IGNORECASE, expand=False)
+    positions = df.groupby(last_names.str.lower()).indices
+    return {name: df.iloc[positions.get(name.split()[-1].lower(), [])] for name in STAR_NAMES}
+
+# Roster fields nfl_data_py can hand back as mixed-type objects, which Parquet refuses;
+# cast to nullable numerics so they cache compactly and still compare as numbers
+NULLABLE_DTYPES = {
+    'jersey_number': 'Int32',
+    'draft_number': 'Int32',
+    'years_exp': 'Int32',
+    'age': 'Float32',
+    'weight': 'Float32',
+    'depth_chart_position': 'string',
+}
+
+def _with_nullable_dtypes(df):
+    """Cast the known mixed-type object columns to their nullable dtypes"""
+    casts = {col: dtype for col, dtype in NULLABLE_DTYPES.items() if col in df.columns and df[col].dtype == object}
+    if not casts:
+        return df
+    df = df.copy()
+    for col, dtype in casts.items():
+        values = df[col] if dtype == 'string' else pd.to_numeric(df[col], errors='coerce')
+        df[col] = values.astype(dtype)
+    return df
+
+def _cache_path(name, years):
+    suffix = f"_{'-'.join(str(year) for year in sorted(years))}" if years else ''
+    return os.path.join(CACHE_DIR, f"{name}{suffix}.parquet")
+
+def cached(name, years, loader):
+    """Return the cached frame for (name, years), calling loader() and caching it on a miss."""
+    path = _cache_path(name, years)
+
+    if os.path.exists(path):
+        return pd.read_parquet(path, engine='pyarrow')
+
+    df = _with_nullable_dtypes(loader())
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(path, engine='pyarrow', compression='zstd')
+    except Exception as e:
+        # Mixed-type object columns can fail to serialize; the data is still usable
+        print(f"⚠️ Could not cache {name} to {path}: {e}")
+        if os.path.exists(path):
+            os.remove(path)
+    return df
+
+@lru_cache(maxsize=8)
+def load_rosters(years):
+    """Seasonal rosters for a tuple of years"""
+    return cached('seasonal_rosters', years, lambda: nfl.import_seasonal_rosters(years=list(years)))
+
+def load_matching_rosters(years, pattern):
+    """
+    Seasonal roster rows whose player_name matches the compiled regex pattern.
+    Reads the cached Parquet through a pyarrow dataset filter so only matching rows
+    are materialized and converted to pandas.
+    """
+    path = _cache_path('seasonal_rosters', years)
+    if not os.path.exists(path):
+        rosters = load_rosters(years)
+        if not os.path.exists(path):
+            # Caching failed; fall back to filtering the in-memory frame
+            return rosters[rosters['player_name'].str.contains(pattern, na=False)].copy()
+
+    name_filter = pc.match_substring_regex(
+        ds.field('player_name'), pattern.pattern, ignore_case=bool(pattern.flags & re.IGNORECASE)
+    )
+    return ds.dataset(path, format='parquet').to_table(filter=name_filter).to_pandas()
+
+@lru_cache(maxsize=8)
+def load_weekly_rosters(years):
+    """Weekly rosters for a tuple of years"""
+    return cached('weekly_rosters', years, lambda: nfl.import_weekly_rosters(years=list(years)))
+
+@lru_cache(maxsize=1)
+def load_players():
+    """The nfl_data_py players master"""
+    return cached('players', None, nfl.import_players)
+
+@lru_cache(maxsize=8)
+def load_draft_picks(years):
+    """Draft picks for a tuple of years"""
+    return cached('draft_picks', years, lambda: nfl.import_draft_picks(years=list(years)))
+
+def teammate_pairs(rosters, id_col='esb_id'):
+    """
+    Every teammate pair per (season, team), enumerated over integer player codes
+    with numpy repeat/arange arithmetic across all groups at once instead of nested Python loops.
+    """
+    rows = rosters[['season', 'team', id_col]].dropna().drop_duplicates()
+    if rows.empty:
+        return pd.DataFrame(columns=['season', 'team', 'player_a', 'player_b'])
+
+    group = rows.groupby(['season', 'team'], observed=True, sort=False).ngroup().to_numpy()
+    codes, uniques = pd.factorize(rows[id_col])
+    order = np.argsort(group, kind='stable')
+    group, codes = group[order], codes[order]
+    bounds = np.r_[0, np.flatnonzero(np.diff(group)) + 1, len(group)]
+    sizes = np.diff(bounds)
+
+    # Row k of a block pairs with every later row of the same block, in triu_indices order:
+    # repeat each row once per partner, then step through the partners with a running offset
+    group_ends = np.repeat(bounds[1:], sizes)
+    partners = group_ends - np.arange(len(group)) - 1
+    first = np.repeat(np.arange(len(group)), partners)
+    pair_starts = np.cumsum(partners) - partners
+    second = first + np.arange(len(first)) - np.repeat(pair_starts, partners) + 1
+
+    first_rows = rows.iloc[order[bounds[:-1]]]
+    pair_counts = sizes * (sizes - 1) // 2
+    return pd.DataFrame({
+        'season': np.repeat(first_rows['season'].to_numpy(), pair_counts),
+        'team': np.repeat(first_rows['team'].to_numpy(), pair_counts),
+        'player_a': uniques.take(codes[first]),
+        'player_b': uniques.take(codes[second]),
+    })
+
+def read_sql_arrow(conn, sql, params=None):
+    """
+    Run a query via COPY ... TO STDOUT and parse the CSV stream with pyarrow,
+    skipping the per-row Python tuples pd.read_sql builds.
+    Params use psycopg2 pyformat style (%(name)s); sql may also be a psycopg2.sql
+    composition, rendered against the connection before wrapping.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        if isinstance(sql, pg_sql.Composable):
+            sql = sql.as_string(cursor)
+        query = cursor.mogrify(sql, params).decode() if params is not None else sql
+        buf = io.BytesIO()
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER)", buf)
+    finally:
+        cursor.close()
+
+    buf.seek(0)
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+    return pa_csv.read_csv(buf, convert_options=convert_options).to_pandas()
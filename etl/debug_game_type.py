@@ -1,26 +1,42 @@
 """
 Debug the game_type filtering that might be excluding Brady/Mahomes
 """
-import nfl_data_py as nfl
 import pandas as pd
+from debug_data import NAME_RE, QB_STAR_RE, buffered_output, load_rosters
+
+def team_season_slice(rosters, team_season_idx, season, team):
+    """Rows for one team-season, looked up from precomputed group positions"""
+    positions = team_season_idx.get((season, team))
+    if positions is None:
+        return rosters.iloc[0:0]
+    return rosters.iloc[positions]
 
 def debug_game_type_filtering():
     print("🔍 DEBUGGING GAME TYPE FILTERING")
     print("=" * 50)
     
     # Load recent years data
-    years = [2020, 2021, 2022, 2023, 2024, 2025]
-    rosters = nfl.import_seasonal_rosters(years=years)
+    years = (2020, 2021, 2022, 2023, 2024, 2025)
+    # Categorical codes make the groupby/isin calls below hash ints instead of strings;
+    # astype returns a new frame, leaving the shared cached one untouched
+    rosters = load_rosters(years).astype(
+        {col: 'category' for col in ('team', 'game_type', 'position', 'player_name')}
+    )
+    
+    # Scan the full frame once; per-player subsets come from the small star frame
+    star_records = rosters[
+        rosters['player_name'].str.contains(QB_STAR_RE, na=False)
+    ]
     
     # Check Brady specifically (retired after 2022)
     print("\n1️⃣ Tom Brady game type analysis:")
-    brady_records = rosters[rosters['player_name'].str.contains('Tom Brady', case=False, na=False)]
+    brady_records = star_records[star_records['player_name'].str.contains(NAME_RE['Tom Brady'])]
     
     if len(brady_records) > 0:
         print(f"   Total Brady records: {len(brady_records)}")
         
         # Group by game_type
-        brady_by_game_type = brady_records.groupby(['season', 'game_type']).size().reset_index(name='count')
+        brady_by_game_type = brady_records.groupby(['season', 'game_type'], observed=True).size().reset_index(name='count')
         print("   Brady records by season/game_type:")
         print(brady_by_game_type.to_string(index=False))
         
@@ -38,13 +54,13 @@ def debug_game_type_filtering():
     
     # Check Mahomes 
     print("\n2️⃣ Patrick Mahomes game type analysis:")
-    mahomes_records = rosters[rosters['player_name'].str.contains('Patrick Mahomes', case=False, na=False)]
+    mahomes_records = star_records[star_records['player_name'].str.contains(NAME_RE['Patrick Mahomes'])]
     
     if len(mahomes_records) > 0:
         print(f"   Total Mahomes records: {len(mahomes_records)}")
         
         # Group by game_type
-        mahomes_by_game_type = mahomes_records.groupby(['season', 'game_type']).size().reset_index(name='count')
+        mahomes_by_game_type = mahomes_records.groupby(['season', 'game_type'], observed=True).size().reset_index(name='count')
         print("   Mahomes records by season/game_type:")
         print(mahomes_by_game_type.to_string(index=False))
         
@@ -72,6 +88,10 @@ def debug_game_type_filtering():
     # Test teammate connection building for Brady/Mahomes specifically
     print("\n4️⃣ Testing teammate connections:")
     
+    # Filter to REG/POST once, then index every (season, team) slice of it in a single pass
+    reg_post = rosters[rosters['game_type'].isin(['REG', 'POST'])]
+    team_season_idx = reg_post.groupby(['season', 'team'], observed=True).indices
+    
     # Brady's 2021 season (TB12 Super Bowl year)
     brady_2021 = brady_records[
         (brady_records['season'] == 2021) & 
@@ -84,11 +104,7 @@ def debug_game_type_filtering():
         brady_esb_id = brady_2021['esb_id'].iloc[0]
         
         # Find his teammates
-        bucs_2021 = rosters[
-            (rosters['season'] == 2021) & 
-            (rosters['team'] == brady_team) &
-            (rosters['game_type'].isin(['REG', 'POST']))
-        ]
+        bucs_2021 = team_season_slice(reg_post, team_season_idx, 2021, brady_team)
         
         print(f"   {brady_team} 2021 REG/POST roster size: {len(bucs_2021)}")
         print(f"   Brady's esb_id: {brady_esb_id}")
@@ -116,11 +132,7 @@ def debug_game_type_filtering():
         mahomes_esb_id = mahomes_2023['esb_id'].iloc[0]
         
         # Find his teammates
-        chiefs_2023 = rosters[
-            (rosters['season'] == 2023) & 
-            (rosters['team'] == mahomes_team) &
-            (rosters['game_type'].isin(['REG', 'POST']))
-        ]
+        chiefs_2023 = team_season_slice(reg_post, team_season_idx, 2023, mahomes_team)
         
         print(f"   {mahomes_team} 2023 REG/POST roster size: {len(chiefs_2023)}")
         print(f"   Mahomes' esb_id: {mahomes_esb_id}")
@@ -133,4 +145,5 @@ def debug_game_type_filtering():
             print("   ❌ PROBLEM: Mahomes not found in his own team roster!")
 
 if __name__ == "__main__":
-    debug_game_type_filtering()
+    with buffered_output():
+        debug_game_type_filtering()
@@ -1,16 +1,16 @@
 """
 Debug why seasonal rosters seem incomplete
 """
-import nfl_data_py as nfl
 import pandas as pd
+from debug_data import buffered_output, load_rosters, load_weekly_rosters
 
 def debug_seasonal_data_quality():
     print("🔍 DEBUGGING SEASONAL ROSTER DATA QUALITY")
     print("=" * 50)
     
     # Get both datasets for comparison
-    seasonal_2023 = nfl.import_seasonal_rosters([2023])
-    weekly_2023 = nfl.import_weekly_rosters([2023])
+    seasonal_2023 = load_rosters((2023,))
+    weekly_2023 = load_weekly_rosters((2023,))
     
     print("1️⃣ Overall comparison:")
     print(f"   Seasonal records: {len(seasonal_2023):,}")
@@ -25,15 +25,15 @@ def debug_seasonal_data_quality():
     print(f"   KC weekly records: {len(kc_weekly)}")
     
     # Get unique KC players from each dataset
-    kc_seasonal_players = set(kc_seasonal['player_name'].unique())
-    kc_weekly_players = set(kc_weekly['player_name'].unique())
+    kc_seasonal_players = pd.Index(kc_seasonal['player_name'].unique())
+    kc_weekly_players = pd.Index(kc_weekly['player_name'].unique())
     
     print(f"   KC unique players (seasonal): {len(kc_seasonal_players)}")
     print(f"   KC unique players (weekly): {len(kc_weekly_players)}")
     
     # Check what's missing
-    missing_from_seasonal = kc_weekly_players - kc_seasonal_players
-    missing_from_weekly = kc_seasonal_players - kc_weekly_players
+    missing_from_seasonal = kc_weekly_players.difference(kc_seasonal_players)
+    missing_from_weekly = kc_seasonal_players.difference(kc_weekly_players)
     
     print(f"   Players in weekly but NOT seasonal: {len(missing_from_seasonal)}")
     print(f"   Players in seasonal but NOT weekly: {len(missing_from_weekly)}")
@@ -43,7 +43,7 @@ def debug_seasonal_data_quality():
     print(f"\n   Mahomes in KC seasonal roster: {mahomes_in_kc_seasonal}")
     
     if not mahomes_in_kc_seasonal and len(missing_from_seasonal) > 0:
-        print(f"   Some missing players: {list(missing_from_seasonal)[:10]}")
+        print(f"   Some missing players: {missing_from_seasonal[:10].tolist()}")
         if 'Patrick Mahomes' in missing_from_seasonal:
             print("   ❌ PROBLEM: Mahomes missing from KC seasonal roster!")
     
@@ -84,22 +84,28 @@ def debug_seasonal_data_quality():
     print(f"   Teams in seasonal: {len(seasonal_teams)} - {sorted(seasonal_teams)}")
     print(f"   Teams in weekly: {len(weekly_teams)} - {sorted(weekly_teams)}")
     
-    missing_teams = set(weekly_teams) - set(seasonal_teams)
-    if missing_teams:
-        print(f"   ❌ Teams missing from seasonal: {missing_teams}")
+    missing_teams = pd.Index(weekly_teams).difference(seasonal_teams)
+    if len(missing_teams) > 0:
+        print(f"   ❌ Teams missing from seasonal: {missing_teams.tolist()}")
     
     # Check a non-playoff team
     non_playoff_teams = ['CHI', 'CAR', 'ARI']  # These probably didn't make playoffs
+    
+    # Per-team stats for every team in one pass each, instead of re-slicing per team
+    seasonal_team_counts = seasonal_2023.groupby('team').size()
+    weekly_team_counts = weekly_2023.groupby('team').size()
+    # One crosstab gives every team's game_type distribution at once
+    game_types_by_team = pd.crosstab(seasonal_2023['team'], seasonal_2023['game_type'])
+    
     for team in non_playoff_teams:
         if team in seasonal_teams:
-            team_seasonal = seasonal_2023[seasonal_2023['team'] == team]
-            team_weekly = weekly_2023[weekly_2023['team'] == team]
-            print(f"\n   {team} seasonal: {len(team_seasonal)} records")
-            print(f"   {team} weekly: {len(team_weekly)} records")
+            seasonal_count = seasonal_team_counts.get(team, 0)
+            print(f"\n   {team} seasonal: {seasonal_count} records")
+            print(f"   {team} weekly: {weekly_team_counts.get(team, 0)} records")
             
-            if len(team_seasonal) > 0:
-                team_game_types = team_seasonal['game_type'].value_counts()
-                print(f"   {team} game types: {team_game_types.to_dict()}")
+            if seasonal_count > 0:
+                team_game_types = game_types_by_team.loc[team]
+                print(f"   {team} game types: {team_game_types[team_game_types > 0].sort_values(ascending=False).to_dict()}")
 
 def suggest_hybrid_approach():
     print(f"\n6️⃣ HYBRID APPROACH SUGGESTION:")
@@ -114,9 +120,10 @@ def suggest_hybrid_approach():
     print("\nExample deduplication:")
     print("```python")
     print("# Get unique player-team combinations per season")
-    print("deduplicated_rosters = weekly_rosters.groupby(['season', 'team', 'player_name']).first().reset_index()")
+    print("deduplicated_rosters = weekly_rosters.drop_duplicates(subset=['season', 'team', 'player_name'])")
     print("```")
 
 if __name__ == "__main__":
-    debug_seasonal_data_quality()
-    suggest_hybrid_approach()
+    with buffered_output():
+        debug_seasonal_data_quality()
+        suggest_hybrid_approach()
@@ -3,50 +3,56 @@ Debug why star players like Brady/Mahomes have 0 connections
 """
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
+from psycopg2 import sql
 import pandas as pd
-import nfl_data_py as nfl
+from debug_data import (
+    STAR_LAST_NAME_RE, STAR_NAMES, buffered_output, load_matching_rosters, load_players, load_rosters,
+    read_sql_arrow, split_by_star, teammate_pairs
+)
 
 load_dotenv()
 
 def debug_star_players():
     engine = create_engine(os.getenv('DATABASE_URL'))
     
-    # Players to investigate
-    star_names = ['Tom Brady', 'Patrick Mahomes', 'Aaron Donald', 'Justin Jefferson']
-    
     print("🔍 DEBUGGING STAR PLAYER CONNECTIONS")
     print("=" * 50)
     
     with engine.connect() as conn:
         # 1. Check what's in our players table
         print("\n1️⃣ Players table records:")
-        players_query = text("""
+        players_query = """
             SELECT id, name, position, college, draft_year, first_season, last_season
             FROM players 
             WHERE name ILIKE ANY(ARRAY['%tom%brady%', '%patrick%mahomes%', '%aaron%donald%', '%justin%jefferson%'])
             ORDER BY name
-        """)
-        players_df = pd.read_sql(players_query, conn)
+        """
+        players_df = read_sql_arrow(conn, players_query)
         print(players_df.to_string(index=False))
         
         # 2. Check raw roster data for these players
         print("\n2️⃣ Checking raw roster data...")
         current_year = 2025
-        years = list(range(2015, current_year + 1))
+        years = tuple(range(2015, current_year + 1))
         
         try:
-            rosters = nfl.import_seasonal_rosters(years=years)
+            # Read only rows matching any star's last name out of the roster Parquet
+            star_rows = load_matching_rosters(years, STAR_LAST_NAME_RE)
+            rows_by_star = split_by_star(star_rows, 'player_name')
             
-            for star in star_names:
+            for star in STAR_NAMES:
                 print(f"\n🔍 {star} in raw rosters:")
-                matches = rosters[rosters['player_name'].str.contains(star.split()[-1], case=False, na=False)]
+                matches = rows_by_star[star]
                 if len(matches) > 0:
                     # Show unique combinations of key identifiers
                     unique_records = matches[['player_id', 'esb_id', 'player_name', 'team', 'season']].drop_duplicates()
                     print(f"   Found {len(unique_records)} unique records:")
-                    for _, row in unique_records.head(5).iterrows():
-                        print(f"   player_id: {row['player_id']}, esb_id: {row['esb_id']}, name: {row['player_name']}")
+                    sample = unique_records.head(5).astype(str)
+                    print('\n'.join(
+                        '   player_id: ' + sample['player_id'] + ', esb_id: ' + sample['esb_id'] +
+                        ', name: ' + sample['player_name']
+                    ))
                 else:
                     print(f"   ❌ No matches found for {star}")
         
@@ -58,7 +64,9 @@ def debug_star_players():
         if len(players_df) > 0:
             player_ids = players_df['id'].tolist()
             
-            connections_query = text("""
+            # Ship the IDs as a VALUES list the planner can hash once for both endpoint checks
+            connections_query = sql.SQL("""
+                WITH ids(pid) AS (VALUES {ids})
                 SELECT 
                     p1.name as player1_name,
                     p2.name as player2_name,
@@ -67,13 +75,13 @@ def debug_star_players():
                 FROM player_connections pc
                 JOIN players p1 ON pc.player1_id = p1.id
                 JOIN players p2 ON pc.player2_id = p2.id
-                WHERE pc.player1_id = ANY(:player_ids) OR pc.player2_id = ANY(:player_ids)
+                WHERE pc.player1_id IN (SELECT pid FROM ids) OR pc.player2_id IN (SELECT pid FROM ids)
                 ORDER BY p1.name
                 LIMIT 10
-            """)
+            """).format(ids=sql.SQL(', ').join(sql.SQL('({})').format(sql.Literal(pid)) for pid in player_ids))
             
             try:
-                connections_df = pd.read_sql(connections_query, conn, params={'player_ids': player_ids})
+                connections_df = read_sql_arrow(conn, connections_query)
                 print(f"Found {len(connections_df)} sample connections:")
                 if len(connections_df) > 0:
                     print(connections_df.to_string(index=False))
@@ -86,25 +94,35 @@ def debug_star_players():
         print("\n4️⃣ Checking for ID consistency issues:")
         try:
             # Get players master data
-            players_master = nfl.import_players()
-            
-            for star in star_names:
+            players_master = load_players()
+
+            # Scan the full master once for every star, then split the small result per star
+            star_master = players_master[
+                players_master['display_name'].str.contains(STAR_LAST_NAME_RE, na=False)
+            ]
+            master_by_star = split_by_star(star_master, 'display_name')
+            db_by_star = split_by_star(players_df, 'name')
+
+            for star in STAR_NAMES:
                 print(f"\n🔍 {star} ID mapping:")
-                
+
                 # Check in master data
-                master_matches = players_master[
-                    players_master['display_name'].str.contains(star.split()[-1], case=False, na=False)
-                ]
+                master_matches = master_by_star[star]
                 
                 if len(master_matches) > 0:
-                    for _, row in master_matches.head(3).iterrows():
-                        print(f"   Master: esb_id={row.get('esb_id', 'N/A')}, gsis_id={row.get('gsis_id', 'N/A')}, name={row.get('display_name', 'N/A')}")
+                    sample = master_matches.head(3).reindex(
+                        columns=['esb_id', 'gsis_id', 'display_name'], fill_value='N/A'
+                    ).astype(str)
+                    print('\n'.join(
+                        '   Master: esb_id=' + sample['esb_id'] + ', gsis_id=' + sample['gsis_id'] +
+                        ', name=' + sample['display_name']
+                    ))
                 
                 # Check what made it to our database
-                db_matches = players_df[players_df['name'].str.contains(star.split()[-1], case=False, na=False)]
+                db_matches = db_by_star[star]
                 if len(db_matches) > 0:
-                    for _, row in db_matches.iterrows():
-                        print(f"   DB: id={row['id']}, name={row['name']}")
+                    db_sample = db_matches[['id', 'name']].astype(str)
+                    print('\n'.join('   DB: id=' + db_sample['id'] + ', name=' + db_sample['name']))
                 else:
                     print(f"   ❌ {star} not found in database")
                     
@@ -117,31 +135,41 @@ def debug_connection_building():
     
     try:
         current_year = 2025
-        years = [2023, 2024]  # Just recent years for testing
+        years = (2023, 2024)  # Just recent years for testing
         
-        rosters = nfl.import_seasonal_rosters(years=years)
+        rosters = load_rosters(years)
         print(f"   Loaded {len(rosters)} roster records")
         
         # Filter for our star players
         star_rosters = rosters[
-            rosters['player_name'].str.contains('Brady|Mahomes|Donald|Jefferson', case=False, na=False)
+            rosters['player_name'].str.contains(STAR_LAST_NAME_RE, na=False)
         ]
         
         print(f"   Found {len(star_rosters)} records for star players")
         
         if len(star_rosters) > 0:
             print("   Sample records:")
-            for _, row in star_rosters[['player_name', 'team', 'season', 'player_id', 'esb_id']].head(5).iterrows():
-                print(f"   {row['player_name']} - {row['team']} ({row['season']}) - player_id: {row['player_id']}, esb_id: {row['esb_id']}")
+            sample = star_rosters[['player_name', 'team', 'season', 'player_id', 'esb_id']].head(5).astype(str)
+            print('\n'.join(
+                '   ' + sample['player_name'] + ' - ' + sample['team'] + ' (' + sample['season'] + ')' +
+                ' - player_id: ' + sample['player_id'] + ', esb_id: ' + sample['esb_id']
+            ))
             
             # Check if they have the canonical ID field
             if 'esb_id' in star_rosters.columns:
                 missing_esb = star_rosters['esb_id'].isna().sum()
                 print(f"   Records missing esb_id: {missing_esb}/{len(star_rosters)}")
+            
+            # Enumerate teammate pairs the way the ETL does (REG/POST only) and count the stars' share
+            pairs = teammate_pairs(rosters[rosters['game_type'].isin(['REG', 'POST'])])
+            star_ids = star_rosters['esb_id'].dropna().unique()
+            star_pairs = pairs[pairs['player_a'].isin(star_ids) | pairs['player_b'].isin(star_ids)]
+            print(f"   Teammate pairs built: {len(pairs):,} ({len(star_pairs):,} involving star players)")
                 
     except Exception as e:
         print(f"   ⚠️ Error in connection building test: {e}")
 
 if __name__ == "__main__":
-    debug_star_players()
-    debug_connection_building()
+    with buffered_output():
+        debug_star_players()
+        debug_connection_building()
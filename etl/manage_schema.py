@@ -5,6 +5,8 @@ import os
 import argparse
 import logging
 from dotenv import load_dotenv
+from psycopg2 import sql
+from psycopg2.extras import execute_values
 from sqlalchemy import (
     create_engine,
     MetaData,
@@ -61,6 +63,37 @@ def create_tables(db_url: str):
         logger.error(f"An error occurred while creating tables: {e}")
         raise
 
+def bulk_upsert(engine, table_name: str, rows: list, conflict_cols: list, page_size: int = 1000) -> int:
+    """
+    Insert a batch of row dicts into table_name with multi-row VALUES pages,
+    skipping rows that conflict on conflict_cols. Returns the number of rows sent.
+    """
+    if not rows:
+        return 0
+
+    columns = list(rows[0].keys())
+    query = sql.SQL("INSERT INTO {table} ({cols}) VALUES %s ON CONFLICT ({conflict}) DO NOTHING").format(
+        table=sql.Identifier(table_name),
+        cols=sql.SQL(', ').join(map(sql.Identifier, columns)),
+        conflict=sql.SQL(', ').join(map(sql.Identifier, conflict_cols)),
+    )
+    values = [tuple(row[col] for col in columns) for row in rows]
+
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            execute_values(cursor, query, values, page_size=page_size)
+        raw.commit()
+    except Exception as e:
+        raw.rollback()
+        logger.error(f"Bulk upsert into '{table_name}' failed: {e}")
+        raise
+    finally:
+        raw.close()
+
+    logger.info(f"Upserted {len(values)} rows into '{table_name}'.")
+    return len(values)
+
 def main():
     parser = argparse.ArgumentParser(description="Manage User-related DB tables.")
     parser.add_argument('--db-url', help='PostgreSQL database URL', default=os.getenv('DATABASE_URL'))
@@ -1,5 +1,8 @@
 import nfl_data_py as nfl
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 import psycopg2
 from sqlalchemy import (
     create_engine, text, Table, Column, MetaData,
@@ -7,17 +10,34 @@ from sqlalchemy import (
     DateTime, func, ForeignKey
 )
 from sqlalchemy.types import JSON
-import os
+import io
+import json
+import re
 from datetime import datetime
 import logging
-from typing import Any, Tuple
-import gc
-import tempfile
-import time
+from typing import Any, Iterator, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Player ID columns are joined on and hashed repeatedly; Arrow-backed strings keep them
+# in contiguous buffers instead of one Python object per value
+ID_DTYPE = 'string[pyarrow]'
+
+# Players whose teammate connections are tallied separately, matched on last name
+STAR_NAMES = [
+    'Patrick Mahomes', 'Josh Allen', 'Lamar Jackson', 'Aaron Rodgers',
+    'Dak Prescott', 'Russell Wilson', 'Kyler Murray',
+    'Christian McCaffrey', 'Derrick Henry', 'Nick Chubb', 'Austin Ekeler',
+    'Saquon Barkley', 'Dalvin Cook', 'Alvin Kamara',
+    'Justin Jefferson', 'Tyreek Hill', 'Davante Adams', 'Stefon Diggs',
+    'DeAndre Hopkins', 'Mike Evans', 'Keenan Allen', 'DK Metcalf',
+    'Travis Kelce', 'George Kittle', 'Mark Andrews', 'Darren Waller'
+]
+STAR_LAST_NAME_RE = re.compile('|'.join(star.split()[-1] for star in STAR_NAMES))
+
 class MVPETLPipeline:
     """
     Minimal viable ETL for NFL racing game
@@ -25,11 +45,22 @@ class MVPETLPipeline:
     """
     
     def __init__(self, db_url: str):
-        self.engine = create_engine(db_url)
+        # Bulk loads go through COPY; any remaining SQLAlchemy executemany (to_sql, bulk updates)
+        # is batched into multi-row VALUES pages by psycopg2 instead of one round-trip per row
+        self.engine = create_engine(db_url, executemany_mode='values_plus_batch', insertmanyvalues_page_size=1000)
         self.current_year = datetime.now().year
         self.start_year = 2020  # REDUCED to just 3 years for ultra-safety
         self.years = list(range(self.start_year, self.current_year + 1))
-        self.roster_temp_file = os.path.join(tempfile.gettempdir(), 'rosters.parquet')
+        # The only roster fields the connection estimate reads
+        self.ROSTER_COLUMNS = ['id', 'team', 'season', 'college', 'draft_year']
+        # Weekly roster fields the enrichment and connection steps read; the rest are dropped on load
+        self.WEEKLY_ROSTER_COLUMNS = [
+            'season', 'week', 'game_type', 'team', 'player_name', 'position', 'college', 'esb_id', 'player_id'
+        ]
+        # Preseason weeks never produce connections, so they are dropped as each year loads
+        self.MEANINGFUL_GAMES = ['REG', 'WC', 'DIV', 'CON', 'SB']
+        # Years downloaded concurrently ahead of the one being processed (network-bound, so threads overlap)
+        self.ROSTER_DOWNLOAD_WORKERS = 4
         
         # ULTRA-SAFE LIMITS
         self.MAX_TOTAL_CONNECTIONS = 50000      # Reduced for a more focused skill player graph
@@ -41,6 +72,11 @@ class MVPETLPipeline:
         # Connection tracking
         self.connection_count = 0
         
+        # Players master, downloaded once and shared by every step that needs it
+        self._players_master = None
+        # (players_df, rosters_df) extracted for estimate_connection_count, reused by later estimates
+        self._estimate_frames = None
+        
         # Define table schema for automatic creation
         self.metadata = MetaData()
         self.players_table = Table('players', self.metadata,
@@ -53,11 +89,14 @@ class MVPETLPipeline:
             Column('first_season', Integer),
             Column('last_season', Integer)
         )
+        # Mirrors _reset_connections_table: created UNLOGGED with no primary key or indexes,
+        # which _set_connections_logged and _create_indexes add back after the bulk load
         self.connections_table = Table('player_connections', self.metadata,
-            Column('player1_id', String, primary_key=True),
-            Column('player2_id', String, primary_key=True),
-            Column('connection_type', String, primary_key=True),
-            Column('metadata', JSON)
+            Column('player1_id', String),
+            Column('player2_id', String),
+            Column('connection_type', String),
+            Column('metadata', JSON),
+            prefixes=['UNLOGGED']
         )
         self.seasonal_stats_table = Table('player_seasonal_stats', self.metadata,
             Column('id', Integer, primary_key=True, autoincrement=True),
@@ -84,129 +123,189 @@ class MVPETLPipeline:
         self.metadata.create_all(self.engine)
         logger.info("Tables checked/created successfully.")
         
-    def extract_players(self, significant_esb_ids: set, rosters: pd.DataFrame | None = None) -> pd.DataFrame:
+    def extract_players(
+        self,
+        significant_esb_ids: set,
+        rosters: pd.DataFrame | None = None,
+        return_rosters: bool = False
+    ) -> pd.DataFrame | Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Extracts clean player data, filtered by a set of significant player IDs, and returns
+        the final player summary. With return_rosters=True the distinct ROSTER_COLUMNS rows of
+        every year's enriched rosters are also combined and returned alongside the summary.
+        """
+        player_summaries, roster_parts = [], []
+        for year, enriched_year in self.extract_years_stream(significant_esb_ids, rosters):
+            player_summaries.append(self._summarize_players(enriched_year))
+            if return_rosters:
+                roster_columns = [col for col in self.ROSTER_COLUMNS if col in enriched_year.columns]
+                # Weekly rows collapse per year, so only one row per player-season is kept across years
+                roster_parts.append(enriched_year[roster_columns].drop_duplicates())
+
+        clean_players = self._clean_player_data(player_summaries)
+        if return_rosters:
+            return clean_players, pd.concat(roster_parts, ignore_index=True)
+        return clean_players
+
+    def extract_years_stream(
+        self,
+        significant_esb_ids: set,
+        rosters: pd.DataFrame | None = None
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
         """
-        Extracts clean player data, filtered by a set of significant player IDs,
-        saves enriched weekly rosters to a temp file, and returns the final player summary.
+        Yields (year, enriched_weekly_rosters) one season at a time, so only a single year of
+        rosters is in memory while the caller consumes it. Only the players master and the
+        draft picks are shared across years.
         """
         logger.info(f"Extracting player rosters for years: {self.years}")
-        
-        if rosters is None:
-            logger.info("Loading weekly rosters one year at a time to avoid library bug...")
-            all_rosters = []
-            
-            for year in self.years:
-                try:
-                    logger.info(f"Loading {year} weekly rosters...")
-                    year_rosters = nfl.import_weekly_rosters(years=[year])
-                    year_rosters = year_rosters.reset_index(drop=True)
-                    all_rosters.append(year_rosters)
-                    logger.info(f"  → {year}: {len(year_rosters)} records loaded")
-                except Exception as e:
-                    logger.warning(f"Failed to load {year} rosters: {e}")
-                    continue
-            
-            if not all_rosters:
-                raise Exception("Failed to load any roster data")
-            
-            rosters_weekly = pd.concat(all_rosters, ignore_index=True)
-            logger.info(f"Combined weekly rosters: {rosters_weekly.shape}")
-            del all_rosters
-        else:
-            rosters_weekly = rosters
-            logger.info(f"Using provided rosters: {rosters_weekly.shape}")
+        # Master and draft lookups are deduplicated (and their diagnostics printed) once per run, not per year
+        master_to_merge = self._prepare_master_for_merge(self._load_players_master())
+        draft_picks = nfl.import_draft_picks(years=self.years)[['gsis_id', 'season']].astype({'gsis_id': ID_DTYPE})
+        draft_info = self._prepare_draft_info(draft_picks)
+        del draft_picks
+
+        loaded_any = False
+        for year, year_rosters in self._iter_year_rosters(rosters):
+            loaded_any = True
+            enriched_year = self._enrich_year_rosters(year_rosters, significant_esb_ids, master_to_merge, draft_info)
+            del year_rosters
+            if enriched_year is None:
+                continue
+            yield year, enriched_year
+            del enriched_year
+
+        if not loaded_any:
+            raise Exception("Failed to load any roster data")
+
+    def _iter_year_rosters(self, rosters: pd.DataFrame | None = None) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """Yields (year, weekly_rosters) in year order, from the given frame or from nfl_data_py."""
+        if rosters is not None:
+            logger.info(f"Using provided rosters: {rosters.shape}")
+            rosters = rosters[rosters['game_type'].isin(self.MEANINGFUL_GAMES)]
+            logger.info(f"After game filter: {len(rosters)} records")
+            for year, year_rosters in rosters.groupby('season', sort=True):
+                yield int(year), year_rosters
+            return
+
+        logger.info("Loading weekly rosters one year at a time to avoid library bug...")
+
+        def load_year(year):
+            try:
+                logger.info(f"Loading {year} weekly rosters...")
+                year_rosters = nfl.import_weekly_rosters(years=[year]).reset_index(drop=True)
+                logger.info(f"  → {year}: {len(year_rosters)} records loaded")
+                year_rosters = year_rosters.loc[
+                    year_rosters['game_type'].isin(self.MEANINGFUL_GAMES),
+                    [col for col in self.WEEKLY_ROSTER_COLUMNS if col in year_rosters.columns]
+                ].reset_index(drop=True)
+                logger.info(f"  → {year}: {len(year_rosters)} records after game filter")
+                return year_rosters
+            except Exception as e:
+                logger.warning(f"Failed to load {year} rosters: {e}")
+                return None
+
+        # Up to ROSTER_DOWNLOAD_WORKERS years download concurrently while the current one is processed;
+        # years are still yielded in order and the window bounds how many raw years sit in memory
+        workers = max(1, min(self.ROSTER_DOWNLOAD_WORKERS, len(self.years)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(executor.submit(load_year, year) for year in self.years[:workers])
+            for i, year in enumerate(self.years):
+                year_rosters = pending.popleft().result()
+                if i + workers < len(self.years):
+                    pending.append(executor.submit(load_year, self.years[i + workers]))
+                if year_rosters is not None:
+                    yield year, year_rosters
+
+    def _enrich_year_rosters(
+        self,
+        rosters_weekly: pd.DataFrame,
+        significant_esb_ids: set,
+        master_to_merge: pd.DataFrame,
+        draft_info: pd.DataFrame
+    ) -> pd.DataFrame | None:
+        """Filter one year of weekly rosters and enrich it with master and draft data; None if nothing is left."""
+        # Low-cardinality string columns as categoricals: filters, groupbys and merges
+        # on them hash small integer codes instead of Python strings
+        categorical_cols = {
+            col: 'category' for col in ('team', 'position', 'college', 'game_type') if col in rosters_weekly.columns
+        }
+        # High-cardinality IDs as Arrow strings, matching the master and draft join keys
+        id_cols = {col: ID_DTYPE for col in ('esb_id', 'player_id') if col in rosters_weekly.columns}
+        rosters_weekly = rosters_weekly.astype({**categorical_cols, **id_cols})
 
         # NEW: Filter by significant players FIRST (using esb_id)
         logger.info(f"Filtering {len(rosters_weekly):,} raw records down to {len(significant_esb_ids)} significant players.")
-        rosters_weekly = rosters_weekly[rosters_weekly['esb_id'].isin(significant_esb_ids)]
-        logger.info(f"  → {len(rosters_weekly):,} records remaining after significance filter.")
-
-        meaningful_games = ['REG', 'WC', 'DIV', 'CON', 'SB']
-        rosters_for_connections = rosters_weekly[rosters_weekly['game_type'].isin(meaningful_games)].copy()
-        logger.info(f"After game filter: {len(rosters_for_connections)} records")
+        is_significant = rosters_weekly['esb_id'].isin(significant_esb_ids)
+        significant_count = int(is_significant.sum())
+        logger.info(f"  → {significant_count:,} records remaining after significance filter.")
         
         # Add skill position filtering:
         logger.info("Filtering to skill positions only...")
         skill_positions = ['QB', 'RB', 'WR', 'TE']
-        original_size = len(rosters_for_connections)
-        rosters_for_connections = rosters_for_connections[
-            rosters_for_connections['position'].isin(skill_positions)
-        ].copy()
-        logger.info(f"Skill position filter: {original_size:,} → {len(rosters_for_connections):,} records")
+        # Both masks are applied in one selection, so only the final frame is materialized;
+        # everything downstream reads it or builds new frames, so no defensive copies are needed
+        rosters_for_connections = rosters_weekly.loc[is_significant & rosters_weekly['position'].isin(skill_positions)]
+        logger.info(f"Skill position filter: {significant_count:,} → {len(rosters_for_connections):,} records")
+        del rosters_weekly, is_significant
+
+        if rosters_for_connections.empty:
+            logger.warning("No skill position records left for this year, skipping it")
+            return None
+
         position_counts = rosters_for_connections['position'].value_counts()
         logger.info(f"Position breakdown: {position_counts.to_dict()}")
         self._log_skill_position_stats(rosters_for_connections)
         
-        del rosters_weekly
-        gc.collect()
-        
-        players_master = nfl.import_players()
-        draft_picks = nfl.import_draft_picks(years=self.years)
-        
-        enriched_weekly_rosters = self._merge_player_data(rosters_for_connections, players_master)
+        enriched_weekly_rosters = self._merge_player_data(rosters_for_connections, master_to_merge)
         del rosters_for_connections
-        enriched_weekly_rosters = self._add_draft_info(enriched_weekly_rosters, draft_picks)
-
-        # Fix for pyarrow type error by ensuring potentially mixed-type columns are strings
-        logger.info("Cleaning potentially mixed-type columns for parquet compatibility.")
-        cols_to_str = [
-            'jersey_number', 'draft_number', 'depth_chart_position', 'years_exp', 'age', 'weight'
-        ]
-        for col in cols_to_str:
-            if col in enriched_weekly_rosters.columns:
-                enriched_weekly_rosters[col] = enriched_weekly_rosters[col].astype(str)
-
-        logger.info(f"Saving enriched weekly rosters to temp file: {self.roster_temp_file}")
-        enriched_weekly_rosters.to_parquet(self.roster_temp_file)
-
-        rosters_deduped = (enriched_weekly_rosters
-                .sort_values(['season', 'team', 'player_name', 'week'])
-                .groupby(['season', 'team', 'player_name'])
-                .last()
-                .reset_index())
-        
-        del enriched_weekly_rosters
-        gc.collect()
-
-        clean_players = self._clean_player_data(rosters_deduped)
-        
-        return clean_players
+        return self._add_draft_info(enriched_weekly_rosters, draft_info)
 
-    def _merge_player_data(self, rosters: pd.DataFrame, players_master: pd.DataFrame) -> pd.DataFrame:
-        """Merge roster and player master data using esb_id"""
-        
-        print("✅ Merging rosters with players_master on esb_id")
-        
-        # Check merge compatibility
-        roster_esb_count = rosters['esb_id'].notna().sum()
+    def _prepare_master_for_merge(self, players_master: pd.DataFrame) -> pd.DataFrame:
+        """Project, rename and deduplicate players_master on esb_id for the per-year merges"""
         master_esb_count = players_master['esb_id'].notna().sum()
-        overlap = len(set(rosters['esb_id'].dropna()) & set(players_master['esb_id'].dropna()))
-        
-        print(f"🔍 Roster esb_id non-null: {roster_esb_count}")
+        master_dups = players_master['esb_id'].dropna().duplicated().sum()
         print(f"🔍 Master esb_id non-null: {master_esb_count}")
-        print(f"🔍 ESB ID overlap: {overlap}")
-        
-        # Check for duplicates
-        roster_dups = rosters['esb_id'].duplicated().sum()
-        master_dups = players_master['esb_id'].duplicated().sum()
-        print(f"🔍 Roster esb_id duplicates: {roster_dups}")
         print(f"🔍 Master esb_id duplicates: {master_dups}")
         
+        # Project to the merge columns first so deduplication only moves those
+        # Rows without an esb_id can't match anything, and pandas would join NaN keys to each other
+        master_to_merge = players_master[['esb_id', 'display_name', 'college_name', 'position', 'gsis_id']].rename(columns={
+            'position': 'position_master',
+            'college_name': 'college_master',
+            'display_name': 'display_name_master'
+        }).dropna(subset=['esb_id'])
+
         # Deduplicate players_master to avoid cartesian product
         if master_dups > 0:
             print("⚠️ Deduplicating players_master on esb_id (keeping first)")
-            players_master_clean = players_master.drop_duplicates(subset=['esb_id'], keep='first')
-            print(f"🔧 Players master: {len(players_master)} → {len(players_master_clean)} after dedup")
-        else:
-            players_master_clean = players_master
+            master_to_merge = master_to_merge.drop_duplicates(subset=['esb_id'], keep='first')
+            print(f"🔧 Players master: {len(players_master)} → {len(master_to_merge)} after dedup")
+        
+        return master_to_merge
 
-        master_to_merge = players_master_clean[['esb_id', 'display_name', 'college_name', 'position', 'gsis_id']].rename(columns={
-            'position': 'position_master',
-            'college_name': 'college_master',
-            'display_name': 'display_name_master'
-        })
+    def _prepare_draft_info(self, draft_picks: pd.DataFrame) -> pd.DataFrame:
+        """One draft_year row per gsis_id, so the per-year left merges can never fan out roster rows"""
+        print(f"🔍 Draft picks with gsis_id: {draft_picks['gsis_id'].notna().sum()}")
+        return (draft_picks[['gsis_id', 'season']]
+            .dropna(subset=['gsis_id'])
+            .drop_duplicates(subset=['gsis_id'], keep='first')
+            .rename(columns={'season': 'draft_year'}))
+
+    def _merge_player_data(self, rosters: pd.DataFrame, master_to_merge: pd.DataFrame) -> pd.DataFrame:
+        """Merge roster data with the prepared (esb_id-unique) player master"""
+        
+        print("✅ Merging rosters with players_master on esb_id")
+        
+        # Compatibility diagnostics are a full pass over the year's rosters; only pay for them when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            roster_esb_count = rosters['esb_id'].notna().sum()
+            # Distinct roster IDs found in the master, via pandas' hash table rather than Python sets
+            overlap = int(rosters['esb_id'].dropna().drop_duplicates().isin(master_to_merge['esb_id']).sum())
+            roster_dups = rosters['esb_id'].duplicated().sum()
+            logger.debug(f"Roster esb_id non-null: {roster_esb_count}, ESB ID overlap: {overlap}, "
+                         f"roster esb_id duplicates: {roster_dups}")
         
-        merged = rosters.merge(master_to_merge, on='esb_id', how='left')
+        merged = rosters.merge(master_to_merge, on='esb_id', how='left', validate='many_to_one')
         
         print(f"🔍 After merge shape: {merged.shape} (should be close to roster size: {rosters.shape[0]})")
         
@@ -235,25 +334,20 @@ class MVPETLPipeline:
         
         return merged
 
-    def _add_draft_info(self, players_df: pd.DataFrame, draft_picks: pd.DataFrame) -> pd.DataFrame:
-        """Add draft information using gsis_id mapping"""
+    def _add_draft_info(self, players_df: pd.DataFrame, draft_info: pd.DataFrame) -> pd.DataFrame:
+        """Add draft information using the prepared gsis_id → draft_year mapping"""
         
         print("✅ Adding draft info via gsis_id")
         
         gsis_id_count = players_df['gsis_id'].notna().sum() if 'gsis_id' in players_df.columns else 0
-        draft_gsis_count = draft_picks['gsis_id'].notna().sum()
-        
         print(f"🔍 Players with gsis_id: {gsis_id_count}")
-        print(f"🔍 Draft picks with gsis_id: {draft_gsis_count}")
         
-        if gsis_id_count > 0 and draft_gsis_count > 0:
-            overlap = len(set(players_df['gsis_id'].dropna()) & set(draft_picks['gsis_id'].dropna()))
-            print(f"🔍 GSIS ID overlap: {overlap}")
-            
-            draft_info = draft_picks[['gsis_id', 'season']].copy()
-            draft_info = draft_info.rename(columns={'season': 'draft_year'})
+        if gsis_id_count > 0 and not draft_info.empty:
+            if logger.isEnabledFor(logging.DEBUG):
+                overlap = int(players_df['gsis_id'].dropna().drop_duplicates().isin(draft_info['gsis_id']).sum())
+                logger.debug(f"GSIS ID overlap: {overlap}")
             
-            merged = players_df.merge(draft_info, on='gsis_id', how='left')
+            merged = players_df.merge(draft_info, on='gsis_id', how='left', validate='many_to_one')
             
             try:
                 draft_success_count = ((merged['draft_year'].notna()) & (merged['draft_year'] > 0)).sum()
@@ -268,18 +362,18 @@ class MVPETLPipeline:
         
         merged['draft_year'] = merged['draft_year'].fillna(0).astype(int)
         
-        merged['id'] = merged['esb_id'].fillna(merged['gsis_id'])
-        missing_id_count = merged['id'].isna().sum()
+        # Canonical ID: esb_id, then gsis_id, then the roster's player_id, coalesced in a single assignment
+        canonical_id = merged['esb_id'].fillna(merged['gsis_id'])
+        missing_id_count = canonical_id.isna().sum()
         if missing_id_count > 0:
             logger.warning(f"{missing_id_count} records have no esb_id or gsis_id. Using original player_id as fallback.")
-            merged['id'].fillna(merged['player_id'], inplace=True)
+            canonical_id = canonical_id.fillna(merged['player_id'])
+        merged['id'] = canonical_id
             
         return merged
         
-    def _clean_player_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and deduplicate player data"""
-        
-        logger.info("Cleaning and deduplicating player data...")
+    def _summarize_players(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate one year of enriched rosters to one raw row per player, before cleaning"""
         print(f"🔍 Raw merged data shape: {df.shape}")
         
         if 'id' not in df.columns:
@@ -298,7 +392,7 @@ class MVPETLPipeline:
         if 'draft_year' in df.columns:
             agg_named['draft_year'] = ('draft_year', 'first')
         if 'team' in df.columns:
-            agg_named['teams'] = ('team', lambda x: list(x.unique()))
+            agg_named['teams'] = ('team', 'unique')
         if 'season' in df.columns:
             agg_named['first_season'] = ('season', 'min')
             agg_named['last_season'] = ('season', 'max')
@@ -309,16 +403,41 @@ class MVPETLPipeline:
             print("❌ No valid columns found for aggregation")
             return pd.DataFrame()
 
+        return self._aggregate_players(df, agg_named)
+
+    def _aggregate_players(self, df: pd.DataFrame, agg_named: dict) -> pd.DataFrame:
+        """Named per-player aggregation, via pyarrow with a pandas fallback"""
         try:
-            player_summary = (
-                df.groupby('id')
-                  .agg(**agg_named)
-                  .reset_index()
-            )
-            print(f"🔍 After groupby shape: {player_summary.shape}")
-        except Exception as e:
-            print(f"❌ Groupby failed even with named aggregation: {e}")
-            raise
+            player_summary = self._arrow_player_summary(df, agg_named)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            print(f"⚠️ Arrow aggregation unavailable ({e}), falling back to pandas")
+            try:
+                player_summary = self._pandas_player_summary(df, agg_named)
+            except Exception as e:
+                print(f"❌ pandas aggregation failed too: {e}")
+                raise
+        print(f"🔍 After groupby shape: {player_summary.shape}")
+        return player_summary
+
+    def _clean_player_data(self, player_summaries: list) -> pd.DataFrame:
+        """Combine the per-year player summaries, then clean and deduplicate player data"""
+        
+        logger.info("Cleaning and deduplicating player data...")
+        
+        player_summaries = [summary for summary in player_summaries if not summary.empty]
+        if not player_summaries:
+            print("❌ No player summaries to combine")
+            return pd.DataFrame()
+
+        # Years arrive in order, so 'first' across the yearly rows is still each player's first
+        # non-null value; one row per team lets the teams lists be re-uniqued across years
+        combined = pd.concat(player_summaries, ignore_index=True)
+        if 'teams' in combined.columns:
+            combined = combined.explode('teams')
+        combine_funcs = {'teams': 'unique', 'first_season': 'min', 'last_season': 'max'}
+        player_summary = self._aggregate_players(combined, {
+            col: (col, combine_funcs.get(col, 'first')) for col in combined.columns if col != 'id'
+        })
 
         for col in ['college', 'position', 'draft_year', 'teams', 'first_season', 'last_season', 'gsis_id']:
             if col not in player_summary.columns:
@@ -356,243 +475,337 @@ class MVPETLPipeline:
         
         return player_summary
     
+    def _arrow_player_summary(self, df: pd.DataFrame, agg_named: dict) -> pd.DataFrame:
+        """
+        Run the named per-player aggregation as a pyarrow hash group_by, so the teams
+        list-of-unique aggregation is evaluated natively rather than per group in Python.
+        Single-threaded to keep 'first' in row order; output is sorted by id like pandas.
+        """
+        arrow_funcs = {'first': 'first', 'min': 'min', 'max': 'max', 'unique': 'distinct'}
+        source_cols = list(dict.fromkeys(col for col, _ in agg_named.values()))
+        table = pa.Table.from_pandas(df[['id'] + source_cols], preserve_index=False)
+        
+        aggregations = [(col, arrow_funcs[func]) for col, func in agg_named.values()]
+        grouped = table.group_by('id', use_threads=False).aggregate(aggregations).sort_by('id')
+        
+        summary = {'id': grouped.column('id').to_pandas()}
+        for name, (col, func) in agg_named.items():
+            column = grouped.column(f"{col}_{arrow_funcs[func]}")
+            # List columns come back as numpy arrays from to_pandas; keep plain lists
+            summary[name] = pd.Series(column.to_pylist()) if func == 'unique' else column.to_pandas()
+        return pd.DataFrame(summary)
+
+    def _pandas_player_summary(self, df: pd.DataFrame, agg_named: dict) -> pd.DataFrame:
+        """
+        pandas equivalent of _arrow_player_summary without groupby.agg: each 'first' column is
+        a drop_duplicates on the non-null (id, value) rows, min/max are single-column groupby
+        reductions, and the unique teams come from the distinct (id, team) rows.
+        """
+        ids = pd.Index(df['id'].dropna().unique()).sort_values()
+        summary = {'id': ids.to_numpy()}
+        for name, (col, func) in agg_named.items():
+            if func == 'first':
+                values = df[['id', col]].dropna().drop_duplicates(subset=['id']).set_index('id')[col]
+            elif func == 'unique':
+                # agg(list) can't cast lists back to a categorical, so list plain objects
+                pairs = df[['id', col]].drop_duplicates().astype({col: object})
+                values = pairs.groupby('id', sort=False)[col].agg(list)
+            else:
+                values = df.groupby('id')[col].agg(func)
+            summary[name] = values.reindex(ids).to_numpy()
+        return pd.DataFrame(summary)
+
     def _load_players(self, players_df: pd.DataFrame):
-        """Replaces the players table with the new data, using batching."""
+        """Truncates the players table and reloads it with a single COPY, in one transaction."""
         logger.info("Loading players to database...")
 
         # Drop gsis_id before loading, it's not part of the final players table schema
         players_to_load = players_df.drop(columns=['gsis_id'], errors='ignore')
 
-        batch_size = 500  # A very safe batch size for any environment
-        total_batches = (len(players_to_load) - 1) // batch_size + 1
-
         try:
-            # First batch replaces the table
-            logger.info(f"  -> Loading player batch 1/{total_batches}")
-            players_to_load.iloc[:batch_size].to_sql(
-                'players',
-                self.engine,
-                if_exists='replace',
-                index=False,
-                method='multi'
-            )
-            time.sleep(0.05) # Give the DB a break
-
-            # Subsequent batches append to the table
-            for i in range(1, total_batches):
-                logger.info(f"  -> Loading player batch {i + 1}/{total_batches}")
-                start = i * batch_size
-                end = start + batch_size
-                players_to_load.iloc[start:end].to_sql(
-                    'players',
-                    self.engine,
-                    if_exists='append',
-                    index=False,
-                    method='multi'
+            # Creates the table on the first ever run; an existing table keeps its schema
+            players_to_load.head(0).to_sql('players', self.engine, if_exists='append', index=False)
+
+            # teams is stored as the Postgres array text psycopg2's list adaptation used to produce
+            if 'teams' in players_to_load.columns:
+                players_to_load = players_to_load.assign(
+                    teams=[self._pg_array_literal(teams) for teams in players_to_load['teams']]
                 )
-                time.sleep(0.05) # Give the DB a break
+
+            # TRUNCATE and the COPY share one transaction, so readers never see an empty table
+            self._copy_dataframe('players', players_to_load, truncate=True)
 
             logger.info(f"Loaded {len(players_to_load)} players")
         except Exception as e:
             logger.error(f"Player database load failed: {e}")
             raise
 
-    def _load_connections_batch(self, connections_df: pd.DataFrame, is_first_batch: bool = False):
-        """Helper to load a DataFrame of connections in batches."""
+    @staticmethod
+    def _pg_array_literal(values) -> str | None:
+        """Render a list-like as a Postgres array literal ({KC,"LA Rams"}); None stays NULL."""
+        if values is None or (np.ndim(values) == 0 and pd.isna(values)):
+            return None
+        elements = []
+        for value in values:
+            if pd.isna(value):
+                elements.append('NULL')
+                continue
+            value = str(value)
+            if value == '' or value.upper() == 'NULL' or any(ch in value for ch in '{},"\\ \t\n'):
+                value = '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+            elements.append(value)
+        return '{' + ','.join(elements) + '}'
+
+    def _copy_dataframe(self, table_name: str, df: pd.DataFrame, chunk_size: int = 100_000, truncate: bool = False):
+        """
+        Stream a DataFrame into an existing table with COPY FROM STDIN, in one transaction.
+        With truncate=True the table is emptied first, inside the same transaction.
+        """
+        columns = ', '.join(f'"{col}"' for col in df.columns)
+        copy_sql = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV)"
+        
+        raw_conn = self.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor:
+                self._tune_bulk_transaction(cursor)
+                if truncate:
+                    cursor.execute(f"TRUNCATE {table_name}")
+                for buf in self._csv_buffers(df, chunk_size):
+                    cursor.copy_expert(copy_sql, buf)
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+
+    @staticmethod
+    def _tune_bulk_transaction(cursor):
+        """
+        Bulk-load settings for the current transaction only (SET LOCAL), so pooled connections
+        go back to the server defaults: commits don't wait for the WAL flush (a crash can only lose
+        the last few loads, which a rerun rebuilds) and the staging self-join sorts in memory.
+        """
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        cursor.execute("SET LOCAL work_mem = '256MB'")
+
+    @staticmethod
+    def _csv_buffers(df: pd.DataFrame, chunk_size: int = 100_000) -> Iterator[io.BytesIO]:
+        """
+        Encode a DataFrame as headerless CSV for COPY, one bounded buffer per chunk of rows.
+        pyarrow's writer encodes whole columns natively instead of formatting row by row;
+        nulls come out as empty unquoted fields, which COPY loads as NULL.
+        """
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        write_options = pa_csv.WriteOptions(include_header=False)
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            buf = io.BytesIO()
+            pa_csv.write_csv(batch, buf, write_options)
+            buf.seek(0)
+            yield buf
+
+    def _load_connections_batch(self, connections_df: pd.DataFrame):
+        """Helper to append a DataFrame of connections via COPY."""
         if connections_df.empty:
             return
 
-        # On the first batch, we replace the table. On others, we append.
-        if_exists_strategy = 'replace' if is_first_batch else 'append'
-        
-        batch_size = 500 # Reduced to a very safe size
-        total_batches = (len(connections_df) - 1) // batch_size + 1
-        
-        # Each batch will now run in its own transaction, initiated by to_sql
-        for i, start in enumerate(range(0, len(connections_df), batch_size)):
-            end = start + batch_size
-            batch = connections_df.iloc[start:end]
-            try:
-                batch.to_sql(
-                    'player_connections',
-                    self.engine, # Use the engine directly to allow auto-transactions
-                    if_exists=if_exists_strategy,
-                    index=False,
-                    method='multi',
-                    dtype={'metadata': JSON}
+        try:
+            # Builders hand over metadata already serialized, which COPY takes as JSON text
+            self._copy_dataframe('player_connections', connections_df)
+        except Exception as e:
+            logger.error(f"Failed to load a batch of {len(connections_df)} connections.")
+            raise e
+
+    def _reset_connections_table(self):
+        """
+        Empty player_connections with TRUNCATE and switch it to UNLOGGED with no indexes,
+        so the bulk load skips WAL and per-row B-tree maintenance. _set_connections_logged
+        and _create_indexes restore durability and indexes once loading is done.
+        """
+        with self.engine.begin() as conn:
+            # No primary key: the same pair can legitimately be teammates in several seasons
+            conn.execute(text("""
+                CREATE UNLOGGED TABLE IF NOT EXISTS player_connections (
+                    player1_id TEXT,
+                    player2_id TEXT,
+                    connection_type TEXT,
+                    metadata JSON
                 )
-                # After the first chunk of the first batch, all subsequent writes must be appends.
-                if_exists_strategy = 'append'
+            """))
+            conn.execute(text("DROP INDEX IF EXISTS idx_connections_player1, idx_connections_player2"))
+            conn.execute(text("TRUNCATE player_connections"))
+            # Rewrites the table, which is cheap now that it is empty
+            conn.execute(text("ALTER TABLE player_connections SET UNLOGGED"))
 
-                if total_batches > 1:
-                    logger.info(f"  -> Loaded connection batch {i + 1}/{total_batches}")
-                
-                time.sleep(0.05) # Give the DB a small break after each batch
+    def _set_connections_logged(self):
+        """Make the bulk-loaded player_connections table crash-safe again"""
+        with self.engine.begin() as conn:
+            conn.execute(text("ALTER TABLE player_connections SET LOGGED"))
 
-            except Exception as e:
-                logger.error(f"Failed to load a batch of {len(connections_df)} connections.")
-                raise e
-
-    def _build_and_load_teammate_connections(self) -> int:
-        """Processes and loads teammate connections from temp file year-by-year."""
-        total_teammate_conns = 0
-        
-        rosters_cols = pd.read_parquet(self.roster_temp_file, columns=['season'])
-        years = sorted(rosters_cols['season'].unique())
-        del rosters_cols
-        
-        is_first_data_batch = True
-        logger.info("Building and loading teammate connections year-by-year...")
-        for year in years:
-            rosters_for_year = pd.read_parquet(self.roster_temp_file, filters=[('season', '==', year)])
-            connections = self._build_teammate_connections(rosters_for_year)
-
-            if connections:
-                connections_df = pd.DataFrame(connections)
-                logger.info(f"Loading {len(connections_df)} teammate connections for {year}...")
-                self._load_connections_batch(connections_df, is_first_batch=is_first_data_batch)
-                total_teammate_conns += len(connections_df)
-                is_first_data_batch = False # Only the very first batch can replace
-                
-        return total_teammate_conns
-
-    def _process_and_load_connections(self) -> int:
-        """Process connections with global tracking"""
-        logger.info("Processing and loading connections with global limits...")
-        
-        self.connection_count = 0  # Reset counter
-        
-        # 1. Teammate connections (highest priority)
-        logger.info("Building teammate connections...")
-        rosters_cols = pd.read_parquet(self.roster_temp_file, columns=['season'])
-        years = sorted(rosters_cols['season'].unique())
-        del rosters_cols
+    def _load_teammate_connections(self, year: int, rosters_for_year: pd.DataFrame) -> int:
+        """Loads one year's teammate connections, unless the global limit is reached."""
+        if self.connection_count >= self.MAX_TOTAL_CONNECTIONS:
+            logger.warning(f"Connection limit reached, skipping teammate connections for {year}")
+            return 0
         
-        is_first_batch = True
-        for year in years:
-            if self.connection_count >= self.MAX_TOTAL_CONNECTIONS:
-                logger.warning(f"Connection limit reached, stopping at year {year}")
-                break
-                
-            rosters_for_year = pd.read_parquet(self.roster_temp_file, filters=[('season', '==', year)])
-            connections = self._build_teammate_connections(rosters_for_year)
-            
-            if connections:
-                connections_df = pd.DataFrame(connections)
-                logger.info(f"Loading {len(connections_df)} teammate connections for {year}...")
-                self._load_connections_batch(connections_df, is_first_batch=is_first_batch)
-                self.connection_count += len(connections_df)
-                is_first_batch = False
-                
-                logger.info(f"Total connections so far: {self.connection_count}/{self.MAX_TOTAL_CONNECTIONS}")
+        loaded = self._insert_teammate_connections(rosters_for_year)
+        if loaded == 0:
+            return 0
         
-        # 2. Other connections (if room left)
+        self.connection_count += loaded
+        logger.info(f"Loaded {loaded} teammate connections for {year}")
+        logger.info(f"Total connections so far: {self.connection_count}/{self.MAX_TOTAL_CONNECTIONS}")
+        return loaded
+
+    def _load_other_connections(self, other_rosters_df: pd.DataFrame) -> int:
+        """Adds college and draft connections (if room left) once all teammate connections are loaded."""
         remaining_capacity = self.MAX_TOTAL_CONNECTIONS - self.connection_count
         if remaining_capacity > 100:  # Only if significant room left
             logger.info(f"Adding other connections (remaining capacity: {remaining_capacity})")
             
-            other_rosters_df = pd.read_parquet(
-                self.roster_temp_file, 
-                columns=['id', 'college', 'player_name', 'draft_year', 'position', 'season']
-            )
-            
             # College connections
             if self.connection_count < self.MAX_TOTAL_CONNECTIONS:
-                college_connections = self._build_college_connections(other_rosters_df)
-                if college_connections:
-                    connections_df = pd.DataFrame(college_connections)
-                    self._load_connections_batch(connections_df, is_first_batch=False)
+                connections_df = self._build_college_connections(other_rosters_df)
+                if not connections_df.empty:
+                    self._load_connections_batch(connections_df)
                     self.connection_count += len(connections_df)
                     logger.info(f"Total after college: {self.connection_count}/{self.MAX_TOTAL_CONNECTIONS}")
             
             # Draft connections (if still room)
             if self.connection_count < self.MAX_TOTAL_CONNECTIONS:
-                draft_connections = self._build_draft_connections(other_rosters_df)
-                if draft_connections:
-                    connections_df = pd.DataFrame(draft_connections)
-                    self._load_connections_batch(connections_df, is_first_batch=False)
+                connections_df = self._build_draft_connections(other_rosters_df)
+                if not connections_df.empty:
+                    self._load_connections_batch(connections_df)
                     self.connection_count += len(connections_df)
                     logger.info(f"Total after draft: {self.connection_count}/{self.MAX_TOTAL_CONNECTIONS}")
-            
-            del other_rosters_df
-            gc.collect()
         
         logger.info(f"Final connection count: {self.connection_count}")
         return self.connection_count
     
-    def _build_teammate_connections(self, rosters_df: pd.DataFrame) -> list:
-        """Build skill position teammate connections with rich metadata"""
-        connections = []
+    def _insert_teammate_connections(self, rosters_df: pd.DataFrame) -> int:
+        """
+        Build skill position teammate connections with rich metadata inside Postgres: the
+        season rosters are COPYed to a temp staging table and the pairs come from a self-join,
+        so no pair rows are built in Python or sent over the wire. Returns the rows inserted.
+        """
         logger.info(f"Building skill position teammate connections...")
-        season_rosters = rosters_df.groupby(['team', 'season', 'id']).first().reset_index()
-        star_names = [
-            'Patrick Mahomes', 'Josh Allen', 'Lamar Jackson', 'Aaron Rodgers',
-            'Dak Prescott', 'Russell Wilson', 'Kyler Murray',
-            'Christian McCaffrey', 'Derrick Henry', 'Nick Chubb', 'Austin Ekeler',
-            'Saquon Barkley', 'Dalvin Cook', 'Alvin Kamara',
-            'Justin Jefferson', 'Tyreek Hill', 'Davante Adams', 'Stefon Diggs',
-            'DeAndre Hopkins', 'Mike Evans', 'Keenan Allen', 'DK Metcalf',
-            'Travis Kelce', 'George Kittle', 'Mark Andrews', 'Darren Waller'
-        ]
-        star_connection_count = 0
-        processed_teams = 0
-        for (team, season), group in season_rosters.groupby(['team', 'season']):
-            processed_teams += 1
-            players = group['id'].dropna().unique().tolist()
-            if len(players) > self.MAX_TEAM_SIZE:
-                logger.warning(f"Large skill position team: {team} {season} has {len(players)} players")
-            if processed_teams % 32 == 0:
-                logger.info(f"Processed {processed_teams} team-seasons, {len(connections)} connections so far")
-            for i, player1 in enumerate(players):
-                for player2 in players[i+1:]:
-                    if len(connections) >= self.MAX_TOTAL_CONNECTIONS:
-                        logger.warning(f"🚨 Hit connection limit ({self.MAX_TOTAL_CONNECTIONS})")
-                        return connections
-                    p1_data = group[group['id'] == player1].iloc[0]
-                    p2_data = group[group['id'] == player2].iloc[0]
-                    p1_is_star = any(p1_data['player_name'].find(star.split()[-1]) != -1 for star in star_names)
-                    p2_is_star = any(p2_data['player_name'].find(star.split()[-1]) != -1 for star in star_names)
-                    if p1_is_star or p2_is_star:
-                        star_connection_count += 1
-                    metadata = {
-                        'team': team,
-                        'season': int(season),
-                        'position_combo': f"{p1_data['position']}-{p2_data['position']}",
-                        'is_qb_skill': (
-                            (p1_data['position'] == 'QB' and p2_data['position'] in ['WR', 'TE', 'RB']) or
-                            (p2_data['position'] == 'QB' and p1_data['position'] in ['WR', 'TE', 'RB'])
-                        ),
-                        'is_receiving_corps': (
-                            p1_data['position'] in ['WR', 'TE'] and p2_data['position'] in ['WR', 'TE']
-                        ),
-                        'is_backfield': (
-                            p1_data['position'] in ['QB', 'RB'] and p2_data['position'] in ['QB', 'RB']
-                        ),
-                        'involves_star': p1_is_star or p2_is_star
-                    }
-                    connections.append({
-                        'player1_id': player1,
-                        'player2_id': player2,
-                        'connection_type': 'teammate',
-                        'metadata': metadata
-                    })
-        logger.info(f"Created {len(connections)} skill position teammate connections")
-        logger.info(f"Star player connections: {star_connection_count}")
-        return connections
+        # One row per player per team-season: the weekly rows collapse before any pairs are formed,
+        # so each teammate edge is emitted once per season rather than once per week.
+        # Only the staged fields are carried, so the sort and dedupe don't move the other roster columns
+        season_rosters = (
+            rosters_df.loc[
+                rosters_df['id'].notna() & rosters_df['team'].notna() & rosters_df['season'].notna(),
+                ['team', 'season', 'id', 'player_name', 'position']
+            ]
+            .sort_values(['team', 'season', 'id'], kind='stable')
+            .drop_duplicates(subset=['team', 'season', 'id'])
+            .reset_index(drop=True)
+        )
+        if season_rosters.empty:
+            logger.info(f"Created 0 skill position teammate connections")
+            return 0
+        
+        team_sizes = season_rosters.groupby(['team', 'season'], sort=False, observed=True).size()
+        for (team, season), size in team_sizes[team_sizes > self.MAX_TEAM_SIZE].items():
+            logger.warning(f"Large skill position team: {team} {season} has {size} players")
+        
+        # Match the regex against each distinct name once, then flag rows by set membership
+        player_names = pd.Series(season_rosters['player_name'].dropna().unique())
+        star_player_names = player_names[player_names.str.contains(STAR_LAST_NAME_RE)]
+        staged = pd.DataFrame({
+            'id': season_rosters['id'],
+            'team': season_rosters['team'].astype(str),
+            'season': season_rosters['season'].astype(int),
+            'position': season_rosters['position'].astype(str),
+            'is_star': season_rosters['player_name'].isin(star_player_names)
+        })
+        
+        raw_conn = self.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor:
+                self._tune_bulk_transaction(cursor)
+                # C collation compares ids and teams bytewise, like the pandas sort above, so
+                # player1/player2 and the cut-off at the limit follow the same order
+                cursor.execute("""
+                    CREATE TEMP TABLE staging_rosters (
+                        id TEXT COLLATE "C",
+                        team TEXT COLLATE "C",
+                        season INTEGER,
+                        position TEXT,
+                        is_star BOOLEAN
+                    ) ON COMMIT DROP
+                """)
+                for buf in self._csv_buffers(staged):
+                    cursor.copy_expert(
+                        "COPY staging_rosters (id, team, season, position, is_star) FROM STDIN WITH (FORMAT CSV)", buf
+                    )
+                cursor.execute("""
+                    WITH inserted AS (
+                        INSERT INTO player_connections (player1_id, player2_id, connection_type, metadata)
+                        SELECT
+                            a.id,
+                            b.id,
+                            'teammate',
+                            json_build_object(
+                                'team', a.team,
+                                'season', a.season,
+                                'position_combo', a.position || '-' || b.position,
+                                'is_qb_skill', (a.position = 'QB' AND b.position IN ('WR', 'TE', 'RB'))
+                                            OR (b.position = 'QB' AND a.position IN ('WR', 'TE', 'RB')),
+                                'is_receiving_corps', a.position IN ('WR', 'TE') AND b.position IN ('WR', 'TE'),
+                                'is_backfield', a.position IN ('QB', 'RB') AND b.position IN ('QB', 'RB'),
+                                'involves_star', a.is_star OR b.is_star
+                            )
+                        FROM staging_rosters a
+                        JOIN staging_rosters b
+                          ON a.team = b.team AND a.season = b.season AND a.id < b.id
+                        ORDER BY a.team, a.season, a.id, b.id
+                        LIMIT %(limit)s
+                        RETURNING metadata
+                    )
+                    SELECT COUNT(*), COUNT(*) FILTER (WHERE (metadata->>'involves_star')::boolean)
+                    FROM inserted
+                """, {'limit': self.MAX_TOTAL_CONNECTIONS})
+                created, star_connections = cursor.fetchone()
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+        
+        if created >= self.MAX_TOTAL_CONNECTIONS:
+            logger.warning(f"🚨 Hit connection limit ({self.MAX_TOTAL_CONNECTIONS})")
+        logger.info(f"Created {created} skill position teammate connections")
+        logger.info(f"Star player connections: {star_connections}")
+        return created
+    
+    @staticmethod
+    def _connections_frame(player1_ids, player2_ids, connection_type: str, metadata) -> pd.DataFrame:
+        """Assemble a connections DataFrame from parallel column arrays; metadata is pre-serialized JSON text"""
+        return pd.DataFrame({
+            'player1_id': player1_ids,
+            'player2_id': player2_ids,
+            'connection_type': connection_type,
+            'metadata': metadata
+        })
     
-    def _build_college_connections(self, rosters_df: pd.DataFrame) -> list:
+    def _build_college_connections(self, rosters_df: pd.DataFrame) -> pd.DataFrame:
         """Enhanced college connections for skill positions"""
-        connections = []
-        if self.connection_count >= self.MAX_TOTAL_CONNECTIONS:
-            return connections
+        player1_ids, player2_ids, metadata = [], [], []
+        budget = self.MAX_TOTAL_CONNECTIONS - self.connection_count
+        if budget <= 0:
+            return self._connections_frame(player1_ids, player2_ids, 'college', metadata)
         logger.info("Building skill position college connections...")
         skill_players_with_college = rosters_df[
             (rosters_df['college'].notna()) &
             (rosters_df['college'] != 'Unknown') &
             (rosters_df['college'] != '') &
             (rosters_df['position'].isin(['QB', 'RB', 'WR', 'TE']))
-        ][['id', 'college', 'player_name', 'position']].drop_duplicates()
-        for college, group in skill_players_with_college.groupby('college'):
+        ][['id', 'college', 'player_name', 'position']].drop_duplicates(subset=['id', 'college'])
+        # One row per player per college (their first listed name/position), so a player whose
+        # name or position varies across seasons can't produce self-pairs or duplicate pairs
+        for college, group in skill_players_with_college.groupby('college', observed=True):
             players = group['id'].tolist()
             if len(players) > self.MAX_COLLEGE_PLAYERS:
                 positions = group['position'].unique()
@@ -602,38 +815,55 @@ class MVPETLPipeline:
                     pos_players = group[group['position'] == pos]['id'].tolist()
                     balanced_players.extend(pos_players[:players_per_position])
                 remaining_slots = self.MAX_COLLEGE_PLAYERS - len(balanced_players)
-                other_players = [p for p in players if p not in balanced_players]
+                already_balanced = set(balanced_players)
+                other_players = [p for p in players if p not in already_balanced]
                 balanced_players.extend(other_players[:remaining_slots])
                 players = balanced_players
                 logger.info(f"Balanced college network for {college}: {len(players)} skill position players")
             if len(players) >= 2:
-                for i, player1 in enumerate(players):
-                    for player2 in players[i+1:]:
-                        if self.connection_count + len(connections) >= self.MAX_TOTAL_CONNECTIONS:
-                            return connections
-                        p1_pos = group[group['id'] == player1]['position'].iloc[0]
-                        p2_pos = group[group['id'] == player2]['position'].iloc[0]
-                        connections.append({
-                            'player1_id': player1,
-                            'player2_id': player2,
-                            'connection_type': 'college',
-                            'metadata': {
-                                'college': college,
-                                'position_combo': f"{p1_pos}-{p2_pos}",
-                                'same_position': p1_pos == p2_pos
-                            }
+                ids = np.asarray(players, dtype=object)
+                i, j = np.triu_indices(ids.size, k=1)
+                i, j = i[:budget], j[:budget]
+                # A player's position is the first one listed for them at this college
+                first_position = group.drop_duplicates(subset=['id']).set_index('id')['position']
+                player_positions = first_position.reindex(ids).to_numpy()
+                player1_ids.append(ids[i])
+                player2_ids.append(ids[j])
+                # One serialized value per position combo at this college, picked per pair by position codes
+                pos_codes, college_positions = pd.factorize(player_positions, use_na_sentinel=False)
+                combo_metadata = np.array([
+                    [
+                        json.dumps({
+                            'college': college,
+                            'position_combo': f"{pos1}-{pos2}",
+                            'same_position': pos1 == pos2
                         })
+                        for pos2 in college_positions
+                    ]
+                    for pos1 in college_positions
+                ], dtype=object)
+                metadata.append(combo_metadata[pos_codes[i], pos_codes[j]])
+                budget -= i.size
+                if budget <= 0:
+                    break
+        connections = self._connections_frame(
+            np.concatenate(player1_ids) if player1_ids else [],
+            np.concatenate(player2_ids) if player2_ids else [],
+            'college',
+            np.concatenate(metadata) if metadata else []
+        )
         logger.info(f"Created {len(connections)} skill position college connections")
         return connections
     
-    def _build_draft_connections(self, rosters_df: pd.DataFrame) -> list:
+    def _build_draft_connections(self, rosters_df: pd.DataFrame) -> pd.DataFrame:
         """Draft connections with ultra-safe limits"""
-        connections = []
+        player1_ids, player2_ids, metadata = [], [], []
+        budget = self.MAX_TOTAL_CONNECTIONS - self.connection_count
         
         # Early exit if already at limit
-        if self.connection_count >= self.MAX_TOTAL_CONNECTIONS:
+        if budget <= 0:
             logger.warning("Already at connection limit, skipping draft connections")
-            return connections
+            return self._connections_frame(player1_ids, player2_ids, 'draft_class', metadata)
         
         logger.info("Building draft connections with strict limits...")
         
@@ -643,86 +873,107 @@ class MVPETLPipeline:
         ][['id', 'draft_year']].drop_duplicates()
         
         for draft_year, group in players_with_draft.groupby('draft_year'):
-            players = group['id'].tolist()
-            
-            # STRICT draft class limit  
-            if len(players) > self.MAX_DRAFT_PLAYERS:
-                players = players[:self.MAX_DRAFT_PLAYERS]
+            # STRICT draft class limit, applied by slicing the id array before pairs are formed
+            ids = group['id'].to_numpy(dtype=object)[:self.MAX_DRAFT_PLAYERS]
             
-            if len(players) >= 2:
-                for i, player1 in enumerate(players):
-                    for player2 in players[i+1:]:
-                        # EMERGENCY BRAKE
-                        if self.connection_count + len(connections) >= self.MAX_TOTAL_CONNECTIONS:
-                            logger.warning(f"Hit connection limit during draft connections")
-                            return connections
-                        
-                        connections.append({
-                            'player1_id': player1,
-                            'player2_id': player2,
-                            'connection_type': 'draft_class',
-                            'metadata': {'draft_year': int(draft_year)}
-                        })
+            if ids.size >= 2:
+                i, j = np.triu_indices(ids.size, k=1)
+                i, j = i[:budget], j[:budget]
+                player1_ids.append(ids[i])
+                player2_ids.append(ids[j])
+                # Every pair in a class shares the same metadata: serialize it once, broadcast per pair
+                class_metadata = json.dumps({'draft_year': int(draft_year)})
+                metadata.append(np.full(i.size, class_metadata, dtype=object))
+                budget -= i.size
+                
+                # EMERGENCY BRAKE
+                if budget <= 0:
+                    logger.warning(f"Hit connection limit during draft connections")
+                    break
         
+        connections = self._connections_frame(
+            np.concatenate(player1_ids) if player1_ids else [],
+            np.concatenate(player2_ids) if player2_ids else [],
+            'draft_class',
+            np.concatenate(metadata) if metadata else []
+        )
         logger.info(f"Created {len(connections)} draft connections")
         return connections
     
-    def _build_position_connections(self, rosters_df: pd.DataFrame) -> list:
+    def _build_position_connections(self, rosters_df: pd.DataFrame) -> pd.DataFrame:
         """Enhanced position connections for skill positions"""
-        connections = []
-        if self.connection_count >= self.MAX_TOTAL_CONNECTIONS:
-            return connections
+        player1_ids, player2_ids, metadata = [], [], []
+        budget = self.MAX_TOTAL_CONNECTIONS - self.connection_count
+        if budget <= 0:
+            return self._connections_frame(player1_ids, player2_ids, 'position', metadata)
         logger.info("Building enhanced skill position connections...")
         recent_players = rosters_df[rosters_df['season'] >= 2022]
         players_by_position = recent_players[
             recent_players['position'].isin(['QB', 'RB', 'WR', 'TE'])
-        ][['id', 'position', 'player_name']].drop_duplicates()
+        ][['id', 'position', 'player_name']].drop_duplicates(subset=['id', 'position'])
         for position in ['QB', 'RB', 'WR', 'TE']:
             position_players = players_by_position[
                 players_by_position['position'] == position
             ]
-            players = position_players['id'].tolist()
-            if len(players) > self.MAX_POSITION_PLAYERS:
-                players = players[:self.MAX_POSITION_PLAYERS]
-            if len(players) >= 2:
-                logger.info(f"Connecting {len(players)} {position} players")
-                for i, player1 in enumerate(players):
-                    for player2 in players[i+1:]:
-                        if self.connection_count + len(connections) >= self.MAX_TOTAL_CONNECTIONS:
-                            return connections
-                        connections.append({
-                            'player1_id': player1,
-                            'player2_id': player2,
-                            'connection_type': 'position',
-                            'metadata': {
-                                'position': position,
-                                'skill_position_network': True
-                            }
-                        })
+            ids = position_players['id'].to_numpy(dtype=object)[:self.MAX_POSITION_PLAYERS]
+            if ids.size >= 2:
+                logger.info(f"Connecting {ids.size} {position} players")
+                i, j = np.triu_indices(ids.size, k=1)
+                i, j = i[:budget], j[:budget]
+                player1_ids.append(ids[i])
+                player2_ids.append(ids[j])
+                position_metadata = json.dumps({'position': position, 'skill_position_network': True})
+                metadata.append(np.full(i.size, position_metadata, dtype=object))
+                budget -= i.size
+                if budget <= 0:
+                    break
+        connections = self._connections_frame(
+            np.concatenate(player1_ids) if player1_ids else [],
+            np.concatenate(player2_ids) if player2_ids else [],
+            'position',
+            np.concatenate(metadata) if metadata else []
+        )
         logger.info(f"Created {len(connections)} skill position connections")
         return connections
     
     def _create_indexes(self):
-        """Create indexes for fast pathfinding queries"""
+        """
+        Create indexes for fast pathfinding queries. Runs after the bulk load, so each
+        B-tree is built in one sorted pass; the builds run side by side on separate connections
+        and the memory settings only last for each build's transaction.
+        """
         logger.info("Creating database indexes...")
         
-        with self.engine.connect() as conn:
-            conn.execute(text("""
+        index_statements = [
+            """
                 CREATE INDEX IF NOT EXISTS idx_connections_player1 
                 ON player_connections(player1_id, connection_type)
-            """))
-            
-            conn.execute(text("""
+            """,
+            """
                 CREATE INDEX IF NOT EXISTS idx_connections_player2 
                 ON player_connections(player2_id, connection_type)
-            """))
-            
-            conn.execute(text("""
+            """,
+            """
                 CREATE INDEX IF NOT EXISTS idx_players_name 
                 ON players(name)
-            """))
-            
-            conn.commit()
+            """,
+        ]
+        
+        def build_index(statement):
+            with self.engine.begin() as conn:
+                # Enough sort memory to build in memory (times three builds), with parallel workers
+                conn.execute(text("SET LOCAL maintenance_work_mem = '512MB'"))
+                conn.execute(text("SET LOCAL max_parallel_maintenance_workers = 4"))
+                conn.execute(text(statement))
+        
+        with ThreadPoolExecutor(max_workers=len(index_statements)) as executor:
+            # list() re-raises the first failed build here
+            list(executor.map(build_index, index_statements))
+        
+        with self.engine.begin() as conn:
+            # Fresh statistics so the planner uses the new indexes right away
+            conn.execute(text("ANALYZE player_connections"))
+            conn.execute(text("ANALYZE players"))
         
         logger.info("Indexes created successfully")
 
@@ -731,27 +982,41 @@ class MVPETLPipeline:
         total_players = rosters_df['player_name'].nunique()
         logger.info(f"📊 SKILL POSITION ANALYSIS:")
         logger.info(f"   Total skill position players: {total_players:,}")
-        position_stats = rosters_df.groupby('position')['player_name'].nunique().sort_values(ascending=False)
+        position_stats = rosters_df.groupby('position', observed=True)['player_name'].nunique().sort_values(ascending=False)
         for pos, count in position_stats.items():
             logger.info(f"   {pos}: {count:,} unique players")
-        team_season_stats = rosters_df.groupby(['team', 'season']).size()
+        team_season_stats = rosters_df.groupby(['team', 'season'], observed=True).size()
         logger.info(f"   Avg skill players per team-season: {team_season_stats.mean():.1f}")
         logger.info(f"   Max skill players per team-season: {team_season_stats.max()}")
         logger.info(f"   Min skill players per team-season: {team_season_stats.min()}")
         star_names = ['Jefferson', 'Mahomes', 'McCaffrey', 'Kelce', 'Allen', 'Henry']
         logger.info("   Star player verification:")
+        # One regex pass over the distinct names narrows the rows to any star's; each star is then
+        # matched within that small slice instead of rescanning every roster row
+        star_re = re.compile('|'.join(star_names), re.IGNORECASE)
+        player_names = pd.Series(rosters_df['player_name'].dropna().unique())
+        star_rows = rosters_df.loc[
+            rosters_df['player_name'].isin(player_names[player_names.str.contains(star_re)]),
+            ['player_name', 'team', 'season']
+        ]
         for star in star_names:
-            star_records = rosters_df[rosters_df['player_name'].str.contains(star, case=False, na=False)]
+            star_records = star_rows[star_rows['player_name'].str.contains(star, case=False, na=False)]
             if len(star_records) > 0:
                 teams = star_records[['team', 'season']].drop_duplicates()
                 logger.info(f"     {star}: {len(star_records)} records across {len(teams)} team-seasons")
             else:
                 logger.warning(f"     {star}: NOT FOUND")
-        position_combos = rosters_df.groupby(['team', 'season'])['position'].apply(
-            lambda x: '-'.join(sorted(x.unique()))
-        ).value_counts().head(10)
+        # Each team-season's set of positions as a bitmask (one bit per position, alphabetical),
+        # so the combinations are counted with a groupby sum instead of a per-group lambda
+        team_positions = rosters_df[['team', 'season', 'position']].dropna().drop_duplicates()
+        position_labels = team_positions['position'].astype(str)
+        position_names = np.sort(position_labels.unique())
+        position_bits = np.left_shift(1, np.searchsorted(position_names, position_labels.to_numpy()))
+        position_masks = team_positions.assign(bit=position_bits).groupby(['team', 'season'], observed=True)['bit'].sum()
+        position_combos = position_masks.value_counts().head(10)
         logger.info("   Most common position combinations per team:")
-        for combo, count in position_combos.items():
+        for mask, count in position_combos.items():
+            combo = '-'.join(name for bit, name in enumerate(position_names) if mask >> bit & 1)
             logger.info(f"     {combo}: {count} team-seasons")
 
     def extract_and_load_seasonal_stats(self, players_df: pd.DataFrame, all_stats_df: pd.DataFrame):
@@ -799,65 +1064,86 @@ class MVPETLPipeline:
                 stats_to_load[col] = stats_to_load[col].fillna(0)
 
         logger.info(f"Loading {len(stats_to_load)} seasonal stat records...")
-        stats_to_load.to_sql(
-            'player_seasonal_stats',
-            self.engine,
-            if_exists='replace',
-            index=False,
-            method='multi',
-            chunksize=500
-        )
+        # Creates the table on the first ever run, then replaces its rows via TRUNCATE + COPY
+        stats_to_load.head(0).to_sql('player_seasonal_stats', self.engine, if_exists='append', index=False)
+        self._copy_dataframe('player_seasonal_stats', stats_to_load, truncate=True)
         logger.info("Seasonal stats loaded successfully.")
         return len(stats_to_load)
 
+    def _load_players_master(self) -> pd.DataFrame:
+        """The nfl_data_py players master, trimmed to the columns the pipeline reads; fetched once per pipeline"""
+        if self._players_master is None:
+            logger.info("Loading players master...")
+            players_master = nfl.import_players()
+            master_columns = ['esb_id', 'gsis_id', 'display_name', 'college_name', 'position']
+            players_master = players_master[[col for col in master_columns if col in players_master.columns]]
+            self._players_master = players_master.astype(
+                {col: ID_DTYPE for col in ('esb_id', 'gsis_id') if col in players_master.columns}
+            )
+        return self._players_master
+
+    def _identify_significant_players(self) -> Tuple[set, pd.DataFrame]:
+        """
+        Fetch seasonal stats for all years and map players with fantasy impact to ESB IDs.
+        Returns (significant_esb_ids, all_stats_df).
+        """
+        logger.info("Fetching all seasonal stats to identify significant players...")
+        all_stats = []
+        for year in self.years:
+            try:
+                logger.info(f"Fetching seasonal stats for {year}...")
+                year_stats = nfl.import_seasonal_data([year])
+                all_stats.append(year_stats)
+            except Exception as e:
+                logger.warning(f"Could not fetch stats for {year}: {e}")
+
+        if not all_stats:
+            raise Exception("Failed to load any seasonal stats data. Cannot determine significant players.")
+
+        all_stats_df = pd.concat(all_stats, ignore_index=True)
+        if 'player_id' in all_stats_df.columns:
+            all_stats_df.rename(columns={'player_id': 'gsis_id'}, inplace=True)
+
+        # Identify players who have actually had some impact
+        significant_players_df = all_stats_df[all_stats_df['fantasy_points_ppr'] > 1]
+        significant_gsis_ids = set(significant_players_df['gsis_id'].dropna().unique())
+        logger.info(f"Identified {len(significant_gsis_ids)} significant players with fantasy points > 1.")
+
+        # NEW: Map GSIS IDs to ESB IDs for early filtering
+        logger.info("Mapping significant GSIS IDs to ESB IDs for early filtering...")
+        players_master = self._load_players_master()
+        id_map = players_master.dropna(subset=['gsis_id', 'esb_id'])[['gsis_id', 'esb_id']]
+        gsis_to_esb_map = pd.Series(id_map.esb_id.values, index=id_map.gsis_id).to_dict()
+
+        significant_esb_ids = {gsis_to_esb_map.get(gsis_id) for gsis_id in significant_gsis_ids}
+        significant_esb_ids.discard(None) # remove None if any gsis_id was not found
+        logger.info(f"Mapped to {len(significant_esb_ids)} significant ESB IDs.")
+
+        return significant_esb_ids, all_stats_df
+
     def run_mvp_etl(self):
         """Main ETL process for MVP - with safe estimation and incremental loading"""
         logger.info("Starting MVP ETL Pipeline...")
         start_time = datetime.now()
         
         try:
-            # Step 1: Fetch all seasonal stats to identify significant players
-            logger.info("Fetching all seasonal stats to identify significant players...")
-            all_stats = []
-            for year in self.years:
-                try:
-                    logger.info(f"Fetching seasonal stats for {year}...")
-                    year_stats = nfl.import_seasonal_data([year])
-                    all_stats.append(year_stats)
-                except Exception as e:
-                    logger.warning(f"Could not fetch stats for {year}: {e}")
-            
-            if not all_stats:
-                raise Exception("Failed to load any seasonal stats data. Cannot determine significant players.")
-            
-            all_stats_df = pd.concat(all_stats, ignore_index=True)
-            if 'player_id' in all_stats_df.columns:
-                all_stats_df.rename(columns={'player_id': 'gsis_id'}, inplace=True)
-            
-            # Identify players who have actually had some impact
-            significant_players_df = all_stats_df[all_stats_df['fantasy_points_ppr'] > 1]
-            significant_gsis_ids = set(significant_players_df['gsis_id'].dropna().unique())
-            logger.info(f"Identified {len(significant_gsis_ids)} significant players with fantasy points > 1.")
+            # Step 1: Identify significant players from seasonal stats
+            significant_esb_ids, all_stats_df = self._identify_significant_players()
 
-            # NEW: Map GSIS IDs to ESB IDs for early filtering
-            logger.info("Mapping significant GSIS IDs to ESB IDs for early filtering...")
-            players_master = nfl.import_players()
-            id_map = players_master.dropna(subset=['gsis_id', 'esb_id'])[['gsis_id', 'esb_id']]
-            gsis_to_esb_map = pd.Series(id_map.esb_id.values, index=id_map.gsis_id).to_dict()
-
-            significant_esb_ids = {gsis_to_esb_map.get(gsis_id) for gsis_id in significant_gsis_ids}
-            significant_esb_ids.discard(None) # remove None if any gsis_id was not found
-            logger.info(f"Mapped to {len(significant_esb_ids)} significant ESB IDs.")
-
-            # Step 2: Extract and clean player data, filtered by significance
-            players_df = self.extract_players(significant_esb_ids)
-            players_count = len(players_df)
+            is_dry_run = hasattr(self, '_dry_run') and self._dry_run
             
-            if hasattr(self, '_dry_run') and self._dry_run:
+            if is_dry_run:
+                # Step 2: Extract and clean player data, filtered by significance,
+                # keeping the enriched rosters in memory for estimation
+                players_df, rosters_df = self.extract_players(significant_esb_ids, return_rosters=True)
+                players_count = len(players_df)
+                
                 logger.info("DRY RUN - Skipping database load")
                 logger.info("DRY RUN - Using safe estimation instead of building all connections...")
-                estimates = self.estimate_connection_count()
+                estimates = self.estimate_connection_count(players_df, rosters_df)
+                del rosters_df
                 connections_count = estimates.get('capped_total', 0)
+                seasonal_stats_count = 0
                 logger.info(f"DRY RUN Results:")
                 logger.info(f"  Players: {players_count}")
                 logger.info(f"  Estimated connections: {connections_count}")
@@ -866,6 +1152,27 @@ class MVPETLPipeline:
                 # Real run - load to database
                 logger.info("REAL RUN - Loading to database...")
                 
+                # Step 2: Stream the rosters one year at a time, loading each year's teammate
+                # connections straight away and keeping only compact per-year summaries
+                self.connection_count = 0
+                self._reset_connections_table()
+                player_summaries, other_rosters = [], []
+                other_columns = ['id', 'college', 'player_name', 'draft_year', 'position', 'season']
+                for year, enriched_year in self.extract_years_stream(significant_esb_ids):
+                    player_summaries.append(self._summarize_players(enriched_year))
+                    # College/draft builders only need each player's distinct attributes, in (team, id) order
+                    other_rosters.append(
+                        enriched_year[['team'] + other_columns]
+                        .sort_values(['team', 'id'], kind='stable')[other_columns]
+                        .drop_duplicates()
+                    )
+                    self._load_teammate_connections(year, enriched_year)
+                    del enriched_year
+                
+                players_df = self._clean_player_data(player_summaries)
+                players_count = len(players_df)
+                del player_summaries
+                
                 # Step 3: Load players table
                 self._load_players(players_df)
                 logger.info(f"✅ Loaded {players_count} players")
@@ -874,15 +1181,23 @@ class MVPETLPipeline:
                 seasonal_stats_count = self.extract_and_load_seasonal_stats(players_df, all_stats_df)
                 logger.info(f"✅ Loaded {seasonal_stats_count} seasonal stat records")
 
+                # Refcounting frees the frame here; there are no cycles for a full gc pass to find
                 del players_df
-                gc.collect()
 
-                # Step 5: Build and load connections (will use the filtered temp file)
-                connections_count = self._process_and_load_connections()
+                # Step 5: Add college and draft connections on top of the teammate ones
+                other_rosters_df = (
+                    pd.concat(other_rosters, ignore_index=True) if other_rosters
+                    else pd.DataFrame(columns=other_columns)
+                )
+                del other_rosters
+                connections_count = self._load_other_connections(other_rosters_df)
+                del other_rosters_df
+                self._set_connections_logged()
                 logger.info(f"✅ Loaded {connections_count} connections")
                 self._create_indexes()
-                # SAFEGUARD: Remove orphaned connections
-                with self.engine.connect() as conn:
+                # SAFEGUARD: Remove orphaned connections. Connections stream in before players are
+                # loaded, so a foreign key can't enforce this; after this committed delete none are left
+                with self.engine.begin() as conn:
                     result = conn.execute(text("""
                         DELETE FROM player_connections
                         WHERE player1_id NOT IN (SELECT id FROM players)
@@ -899,100 +1214,81 @@ class MVPETLPipeline:
                 'connections_count': connections_count,
                 'seasonal_stats_count': seasonal_stats_count,
                 'duration_seconds': duration.total_seconds(),
-                'status': 'dry_run' if hasattr(self, '_dry_run') and self._dry_run else 'completed'
+                'status': 'dry_run' if is_dry_run else 'completed'
             }
         except Exception as e:
             logger.error(f"ETL pipeline failed: {e}")
             raise
-        finally:
-            # Always clean up temp file
-            if os.path.exists(self.roster_temp_file):
-                logger.info(f"Cleaning up temp file: {self.roster_temp_file}")
-                try:
-                    os.remove(self.roster_temp_file)
-                except Exception as e:
-                    logger.warning(f"Failed to remove temp file: {e}")
     
     def _validate_data_quality(self):
         """Basic data quality checks"""
         with self.engine.connect() as conn:
-            player_count = conn.execute(text("SELECT COUNT(*) FROM players")).scalar()
-            connection_count = conn.execute(text("SELECT COUNT(*) FROM player_connections")).scalar()
+            # One round trip; orphans were already deleted (and counted) right after the load
+            player_count, connection_count = conn.execute(text("""
+                SELECT
+                    (SELECT COUNT(*) FROM players),
+                    (SELECT COUNT(*) FROM player_connections)
+            """)).one()
             
+            # Queried last: if the table doesn't exist yet the failure can't abort the checks above
             try:
                 seasonal_stats_count = conn.execute(text("SELECT COUNT(*) FROM player_seasonal_stats")).scalar()
             except Exception:
                 seasonal_stats_count = 0 # Table might not exist yet on first run
             
-            orphaned = conn.execute(text("""
-                SELECT COUNT(*) FROM player_connections pc
-                WHERE NOT EXISTS (SELECT 1 FROM players p WHERE p.id = pc.player1_id)
-                   OR NOT EXISTS (SELECT 1 FROM players p WHERE p.id = pc.player2_id)
-            """)).scalar()
-            
-            logger.info(f"Data quality check - Players: {player_count}, Connections: {connection_count}, Seasonal Stats: {seasonal_stats_count}, Orphaned: {orphaned}")
-            
-            if orphaned > 0:
-                logger.warning(f"Found {orphaned} orphaned connections!")
+            logger.info(f"Data quality check - Players: {player_count}, Connections: {connection_count}, Seasonal Stats: {seasonal_stats_count}")
 
-    def estimate_connection_count(self) -> dict:
-        """Estimate connection count before building to avoid database explosion"""
+    def estimate_connection_count(
+        self,
+        players_df: pd.DataFrame | None = None,
+        rosters_df: pd.DataFrame | None = None
+    ) -> dict:
+        """
+        Estimate connection count before building to avoid database explosion.
+        Works from in-memory player/roster frames; extracts them if not given.
+        """
         logger.info("🧮 ESTIMATING connection count...")
         
         try:
-            # Extract players but don't build connections yet
-            players_df = self.extract_players()
+            if players_df is None or rosters_df is None:
+                # Extract players but don't build connections yet (and don't persist rosters);
+                # the sources don't change within a run, so repeated estimates reuse the first extraction
+                if self._estimate_frames is None:
+                    significant_esb_ids, _ = self._identify_significant_players()
+                    self._estimate_frames = self.extract_players(significant_esb_ids, return_rosters=True)
+                players_df, rosters_df = self._estimate_frames
             
-            if not os.path.exists(self.roster_temp_file):
-                logger.error("Temp file not found for estimation")
-                return {'safe': False, 'estimated_total': 0}
+            # The yearly frames concatenate to object strings (their categories differ), so re-encode
+            # the group keys: the dedupes and groupbys below then hash small integer codes
+            rosters_df = rosters_df.astype({
+                **{col: 'category' for col in ('team', 'college') if col in rosters_df.columns},
+                'season': 'int16'
+            })
             
-            # Load just the columns we need for estimation
-            rosters_df = pd.read_parquet(
-                self.roster_temp_file, 
-                columns=['team', 'season', 'id', 'college', 'draft_year', 'position', 'player_name']
-            )
+            # The three group-size passes only read rosters_df, so they run side by side;
+            # the capped totals are then applied in order, each within the room the previous left
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                team_sizes = executor.submit(self._team_season_sizes, rosters_df)
+                college_sizes = executor.submit(self._college_sizes, rosters_df)
+                draft_sizes = executor.submit(self._draft_class_sizes, rosters_df)
+                team_sizes, college_sizes, draft_sizes = team_sizes.result(), college_sizes.result(), draft_sizes.result()
             
             # 1. Estimate SEASON-LEVEL teammate connections
-            season_rosters = rosters_df.groupby(['team', 'season', 'id']).first().reset_index()
-            teammate_estimate = 0
-            
-            for (team, season), group in season_rosters.groupby(['team', 'season']):
-                team_size = min(len(group), self.MAX_TEAM_SIZE)
-                team_connections = (team_size * (team_size - 1)) // 2
-                teammate_estimate += team_connections
-                
-                # Stop early if already too many
-                if teammate_estimate > self.MAX_TOTAL_CONNECTIONS:
-                    break
+            teammate_estimate = self._capped_pair_count(team_sizes, self.MAX_TEAM_SIZE, self.MAX_TOTAL_CONNECTIONS)
             
             # 2. Estimate college connections
             college_estimate = 0
             if teammate_estimate < self.MAX_TOTAL_CONNECTIONS:
-                players_with_college = rosters_df[
-                    (rosters_df['college'].notna()) & 
-                    (rosters_df['college'] != 'Unknown')
-                ][['id', 'college']].drop_duplicates()
-                
-                for college, group in players_with_college.groupby('college'):
-                    college_size = min(len(group), self.MAX_COLLEGE_PLAYERS)
-                    if college_size >= 2:
-                        college_connections = (college_size * (college_size - 1)) // 2
-                        college_estimate += college_connections
+                college_estimate = self._capped_pair_count(
+                    college_sizes, self.MAX_COLLEGE_PLAYERS, self.MAX_TOTAL_CONNECTIONS - teammate_estimate
+                )
             
             # 3. Estimate draft connections
             draft_estimate = 0
             if teammate_estimate + college_estimate < self.MAX_TOTAL_CONNECTIONS:
-                players_with_draft = rosters_df[
-                    (rosters_df['draft_year'].notna()) & 
-                    (rosters_df['draft_year'] > 0)
-                ][['id', 'draft_year']].drop_duplicates()
-                
-                for draft_year, group in players_with_draft.groupby('draft_year'):
-                    draft_size = min(len(group), self.MAX_DRAFT_PLAYERS)
-                    if draft_size >= 2:
-                        draft_connections = (draft_size * (draft_size - 1)) // 2
-                        draft_estimate += draft_connections
+                draft_estimate = self._capped_pair_count(
+                    draft_sizes, self.MAX_DRAFT_PLAYERS, self.MAX_TOTAL_CONNECTIONS - teammate_estimate - college_estimate
+                )
             
             total_estimate = teammate_estimate + college_estimate + draft_estimate
             
@@ -1030,6 +1326,46 @@ class MVPETLPipeline:
             logger.error(f"Estimation failed: {e}")
             return {'safe': False, 'estimated_total': 0}
         
+    @staticmethod
+    def _team_season_sizes(rosters_df: pd.DataFrame) -> pd.Series:
+        """Players per team-season; only the sizes matter, so one hash dedupe of the keys is enough"""
+        season_rosters = rosters_df[['team', 'season', 'id']].dropna().drop_duplicates()
+        return season_rosters.groupby(['team', 'season'], observed=True).size()
+
+    @staticmethod
+    def _college_sizes(rosters_df: pd.DataFrame) -> pd.Series:
+        """Distinct players per known college"""
+        players_with_college = rosters_df[
+            (rosters_df['college'].notna()) & 
+            (rosters_df['college'] != 'Unknown')
+        ][['id', 'college']].drop_duplicates()
+        return players_with_college.groupby('college', observed=True).size()
+
+    @staticmethod
+    def _draft_class_sizes(rosters_df: pd.DataFrame) -> pd.Series:
+        """Distinct players per draft class"""
+        players_with_draft = rosters_df[
+            (rosters_df['draft_year'].notna()) & 
+            (rosters_df['draft_year'] > 0)
+        ][['id', 'draft_year']].drop_duplicates()
+        return players_with_draft.groupby('draft_year').size()
+
+    @staticmethod
+    def _capped_pair_count(group_sizes: pd.Series, cap: int, limit: int) -> int:
+        """
+        Total pairs across groups, each group clipped to cap players (groups under 2 add nothing).
+        Counting stops at the first group that takes the running total past limit.
+        """
+        # Pair counts for every clipped size 0..cap, looked up per group by index
+        pairs_by_size = np.arange(cap + 1, dtype=np.int64)
+        pairs_by_size = pairs_by_size * (pairs_by_size - 1) // 2
+        running_total = np.cumsum(pairs_by_size[np.minimum(group_sizes.to_numpy(dtype=np.int64), cap)])
+        if running_total.size == 0:
+            return 0
+        # First group whose running total exceeds the limit, or the last group if none does
+        stop = min(np.searchsorted(running_total, limit, side='right'), running_total.size - 1)
+        return int(running_total[stop])
+
     def run_safe_dry_run(self):
         """Run a completely safe dry run that only estimates, doesn't build connections"""
         logger.info("🧪 SAFE DRY RUN - Estimation only...")